@@ -0,0 +1,27 @@
+"""index_display_groups_group_id
+
+Revision ID: d4e8b1c7f2a9
+Revises: a6908fc49e1d
+Create Date: 2026-10-15 10:12:40.512384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e8b1c7f2a9'
+down_revision: Union[str, Sequence[str], None] = 'a6908fc49e1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_display_groups_group_id'), 'display_groups', ['group_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_display_groups_group_id'), table_name='display_groups')
@@ -0,0 +1,32 @@
+"""index_enabled_schedules
+
+Revision ID: e7c3a9d5b1f4
+Revises: d4e8b1c7f2a9
+Create Date: 2026-10-15 22:14:08.204617
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c3a9d5b1f4'
+down_revision: Union[str, Sequence[str], None] = 'd4e8b1c7f2a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_schedule_enabled_true', 'schedules', ['enabled'], unique=False,
+        postgresql_where=sa.text('enabled = true'),
+        sqlite_where=sa.text('enabled IS 1'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_schedule_enabled_true', table_name='schedules')
@@ -12,8 +12,11 @@ Protocol Documentation:
 """
 
 import asyncio
+import json
 import logging
-from typing import Literal
+import random
+import time
+from typing import Awaitable, Callable, Literal, Optional, TypeVar
 
 import httpx
 
@@ -21,6 +24,106 @@ logger = logging.getLogger(__name__)
 
 PowerStatus = Literal["active", "standby", "error"]
 
+T = TypeVar("T")
+
+# Retry backoff: base * 2**attempt seconds, capped, plus up to 50% jitter
+RETRY_BASE_DELAY = 0.3
+RETRY_MAX_DELAY = 5.0
+
+# Unreachable TVs should fail fast; the answer itself gets the full request timeout
+REST_CONNECT_TIMEOUT = 2.0
+
+# REST JSON-RPC request bodies, serialized once instead of on every attempt
+_REST_GET_POWER_STATUS = json.dumps({
+    "method": "getPowerStatus",
+    "params": [],
+    "version": "1.0",
+    "id": 1,
+}).encode()
+_REST_SET_POWER = {
+    on: json.dumps({
+        "method": "setPowerStatus",
+        "params": [{"status": on}],
+        "version": "1.0",
+        "id": 1,
+    }).encode()
+    for on in (True, False)
+}
+
+# Simple IP request packets (24 bytes: 7-byte header, 16-byte value, newline)
+_SIP_QUERY = b"*SEPOWR################\n"
+# set_power packet per requested state
+_SIP_SET_POWER = {
+    True: b"*SCPOWR0000000000000001\n",
+    False: b"*SCPOWR0000000000000000\n",
+}
+
+# Power answers start with this header; byte 22 (last value digit) is b"1" on / b"0" off
+_SIP_ANSWER = b"*SAPOWR"
+# Notifications the TV pushes unprompted on an open connection (e.g. power changed by remote)
+_SIP_NOTIFY = b"*SN"
+_SIP_PACKET_SIZE = 24
+_SIP_STATE_OFFSET = 22
+
+# Power state barely changes between UI polls; serve repeats from memory
+STATUS_CACHE_TTL = 3.0
+
+# A status query only falls back to Simple IP once REST has failed or taken this long
+STATUS_HEDGE_DELAY = 0.5
+
+
+def _is_unrecoverable(error: Exception) -> bool:
+    """Errors retrying cannot fix (e.g. 401/403 from a wrong PSK)."""
+    return isinstance(error, httpx.HTTPStatusError) and error.response.is_client_error
+
+
+async def _retry(
+    operation: Callable[[], Awaitable[T]],
+    description: str,
+    max_retries: int,
+    total_timeout: float,
+) -> T:
+    """Run an operation, retrying failures with exponential backoff and jitter.
+    
+    The whole call is cut off at the total_timeout deadline, so a hanging TV
+    cannot hold it past its budget. Gives up after max_retries attempts,
+    when the next backoff would exceed the budget, or immediately on an
+    unrecoverable error.
+    
+    Args:
+        operation: Zero-argument coroutine function performing one attempt
+        description: Operation name used in log messages
+        max_retries: Maximum number of attempts
+        total_timeout: Wall-clock budget in seconds for all attempts and backoff
+        
+    Returns:
+        Result of the first successful attempt
+        
+    Raises:
+        Exception: The last attempt's error once retrying stops
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + total_timeout
+    try:
+        # Hard ceiling over attempts and backoff alike, whatever the TV does
+        async with asyncio.timeout_at(deadline):
+            for attempt in range(max_retries):
+                try:
+                    return await operation()
+                except Exception as e:
+                    logger.warning(f"{description} attempt {attempt + 1}/{max_retries} failed: {e}")
+                    if _is_unrecoverable(e) or attempt == max_retries - 1:
+                        raise
+                    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt) * (1 + random.uniform(0, 0.5))
+                    if loop.time() + delay >= deadline:
+                        logger.warning(f"{description} retry budget of {total_timeout}s exhausted")
+                        raise
+                    await asyncio.sleep(delay)
+    except TimeoutError:
+        logger.warning(f"{description} timed out after {total_timeout}s")
+        raise
+    raise ValueError("max_retries must be at least 1")
+
 
 class BraviaRestAdapter:
     """Sony BRAVIA REST API adapter (primary control method).
@@ -29,15 +132,67 @@ class BraviaRestAdapter:
     Requires Pre-Shared Key (PSK) for authentication.
     """
 
-    def __init__(self, timeout: float = 5.0, max_retries: int = 3):
+    __slots__ = (
+        "timeout", "http_timeout", "max_retries", "total_timeout",
+        "_client", "_owns_client", "_client_lock",
+    )
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_retries: int = 3,
+        client: Optional[httpx.AsyncClient] = None,
+        total_timeout: float = 15.0,
+    ):
         """Initialize REST adapter.
         
         Args:
             timeout: HTTP request timeout in seconds
             max_retries: Number of retry attempts on failure
+            client: Shared pooled HTTP client (None = lazily create one owned by this adapter)
+            total_timeout: Wall-clock budget in seconds for all attempts of one call
         """
         self.timeout = timeout
+        self.http_timeout = httpx.Timeout(
+            timeout,
+            connect=min(timeout, REST_CONNECT_TIMEOUT),
+            pool=min(timeout, REST_CONNECT_TIMEOUT),
+        )
         self.max_retries = max_retries
+        self.total_timeout = total_timeout
+        self._client = client
+        self._owns_client = client is None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        timeout=self.http_timeout,
+                        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                    )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this adapter created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _post(self, url: str, headers: dict[str, str], body: bytes) -> httpx.Response:
+        """POST a serialized JSON-RPC body to the TV's system service.
+        
+        Keep-alive connections of the pooled client are reused across calls.
+        """
+        client = await self._get_client()
+        return await client.post(url, headers=headers, content=body, timeout=self.http_timeout)
+
+    @staticmethod
+    def _request_target(ip: str, psk: str) -> tuple[str, dict[str, str]]:
+        """URL and headers for a TV's system service (built once per call, not per attempt)."""
+        return f"http://{ip}/sony/system", {"X-Auth-PSK": psk, "Content-Type": "application/json"}
 
     async def get_power_status(self, ip: str, psk: str) -> PowerStatus:
         """Get TV power status via REST API.
@@ -49,41 +204,27 @@ class BraviaRestAdapter:
         Returns:
             "active" if TV is on, "standby" if off, "error" on failure
         """
-        for attempt in range(self.max_retries):
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"http://{ip}/sony/system",
-                        headers={"X-Auth-PSK": psk},
-                        json={
-                            "method": "getPowerStatus",
-                            "params": [],
-                            "version": "1.0",
-                            "id": 1,
-                        },
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Parse response: {"result": [{"status": "active"}]}
-                    if "result" in data and len(data["result"]) > 0:
-                        status = data["result"][0].get("status", "").lower()
-                        if status in ["active", "standby"]:
-                            return status  # type: ignore
-                    
-                    # Invalid response format
-                    logger.warning(f"Invalid response format from {ip}: {data}")
-                    raise ValueError("Invalid response format")
-                    
-            except Exception as e:
-                logger.warning(
-                    f"REST get_power_status attempt {attempt + 1}/{self.max_retries} failed for {ip}: {e}"
-                )
-                if attempt < self.max_retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s
-                    await asyncio.sleep(2**attempt)
-                    
-        return "error"
+        url, headers = self._request_target(ip, psk)
+
+        async def attempt() -> PowerStatus:
+            response = await self._post(url, headers, _REST_GET_POWER_STATUS)
+            response.raise_for_status()
+            data = response.json()
+
+            # Parse response: {"result": [{"status": "active"}]}
+            if "result" in data and len(data["result"]) > 0:
+                status = data["result"][0].get("status", "").lower()
+                if status in ["active", "standby"]:
+                    return status  # type: ignore
+
+            # Invalid response format
+            logger.warning(f"Invalid response format from {ip}: {data}")
+            raise ValueError("Invalid response format")
+
+        try:
+            return await _retry(attempt, f"REST get_power_status for {ip}", self.max_retries, self.total_timeout)
+        except Exception:
+            return "error"
 
     async def set_power(self, ip: str, psk: str, on: bool) -> bool:
         """Set TV power state via REST API.
@@ -96,39 +237,27 @@ class BraviaRestAdapter:
         Returns:
             True if command succeeded, False on failure
         """
-        for attempt in range(self.max_retries):
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"http://{ip}/sony/system",
-                        headers={"X-Auth-PSK": psk},
-                        json={
-                            "method": "setPowerStatus",
-                            "params": [{"status": on}],
-                            "version": "1.0",
-                            "id": 1,
-                        },
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Success response: {"result": [], "id": 1}
-                    if "result" in data:
-                        logger.info(f"REST set_power({on}) succeeded for {ip}")
-                        return True
-                    
-                    # Error response
-                    logger.warning(f"REST set_power error response from {ip}: {data}")
-                    raise ValueError("Invalid response format")
-                    
-            except Exception as e:
-                logger.warning(
-                    f"REST set_power attempt {attempt + 1}/{self.max_retries} failed for {ip}: {e}"
-                )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2**attempt)
-                    
-        return False
+        url, headers = self._request_target(ip, psk)
+        body = _REST_SET_POWER[bool(on)]
+
+        async def attempt() -> bool:
+            response = await self._post(url, headers, body)
+            response.raise_for_status()
+            data = response.json()
+
+            # Success response: {"result": [], "id": 1}
+            if "result" in data:
+                logger.info(f"REST set_power({on}) succeeded for {ip}")
+                return True
+
+            # Error response
+            logger.warning(f"REST set_power error response from {ip}: {data}")
+            raise ValueError("Invalid response format")
+
+        try:
+            return await _retry(attempt, f"REST set_power for {ip}", self.max_retries, self.total_timeout)
+        except Exception:
+            return False
 
 
 class BraviaSimpleIPAdapter:
@@ -137,57 +266,101 @@ class BraviaSimpleIPAdapter:
     Uses TCP binary protocol on port 20060.
     No authentication required.
     24-byte fixed packet format.
+    
+    One connection per TV is kept open and reused; commands to the same TV
+    are serialized on it so each answer is read by the command that sent it.
     """
 
-    def __init__(self, port: int = 20060, timeout: float = 5.0, max_retries: int = 3):
+    __slots__ = ("port", "timeout", "max_retries", "total_timeout", "_connections", "_locks")
+
+    def __init__(
+        self,
+        port: int = 20060,
+        timeout: float = 5.0,
+        max_retries: int = 3,
+        total_timeout: float = 15.0,
+    ):
         """Initialize Simple IP adapter.
         
         Args:
             port: TCP port (default 20060)
             timeout: Socket timeout in seconds
             max_retries: Number of retry attempts on failure
+            total_timeout: Wall-clock budget in seconds for all attempts of one call
         """
         self.port = port
         self.timeout = timeout
         self.max_retries = max_retries
+        self.total_timeout = total_timeout
+        self._connections: dict[str, tuple[asyncio.StreamReader, asyncio.StreamWriter]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def aclose(self) -> None:
+        """Close every open TV connection."""
+        connections, self._connections = self._connections, {}
+        for _, writer in connections.values():
+            writer.close()
 
-    def _build_packet(self, command: str, code: str, value: str) -> bytes:
-        """Build 24-byte Simple IP Control packet.
+    async def _connect(self, ip: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open the TV's persistent connection."""
+        connection = await asyncio.wait_for(
+            asyncio.open_connection(ip, self.port),
+            timeout=self.timeout,
+        )
+        self._connections[ip] = connection
+        return connection
+
+    async def _exchange(self, ip: str, packet: bytes) -> bytes:
+        """Send one packet on the TV's persistent connection and return its answer.
         
-        Args:
-            command: Command type (*SC=set, *SE=enquiry)
-            code: Feature code (e.g., POWR)
-            value: Value string (padded with #)
-            
-        Returns:
-            24-byte packet ending with newline
+        The connection is opened on first use and reopened after it closes.
+        A reused connection the TV dropped while idle is reopened once straight
+        away, without costing a retry.
         """
-        # Format: {command}{code}{value}\n
-        # Total length must be 24 bytes
-        packet = f"{command}{code}{value}"
-        # Pad with # to reach 23 bytes, then add \n
-        packet = packet.ljust(23, "#") + "\n"
-        return packet.encode("ascii")
-
-    def _parse_response(self, data: bytes) -> tuple[str, str, str]:
-        """Parse Simple IP Control response packet.
+        lock = self._locks.setdefault(ip, asyncio.Lock())
+        async with lock:
+            connection = self._connections.get(ip)
+            reused = connection is not None and not connection[1].is_closing()
+            if not reused:
+                connection = await self._connect(ip)
+
+            try:
+                return await self._send_packet(ip, connection, packet)
+            except (asyncio.IncompleteReadError, ConnectionError) as e:
+                if not reused:
+                    raise
+                logger.debug(f"Idle Simple IP connection to {ip} was closed ({e!r}), reconnecting")
+
+            return await self._send_packet(ip, await self._connect(ip), packet)
+
+    async def _send_packet(
+        self,
+        ip: str,
+        connection: tuple[asyncio.StreamReader, asyncio.StreamWriter],
+        packet: bytes,
+    ) -> bytes:
+        """Write a packet and read its answer, skipping notifications.
         
-        Args:
-            data: Raw response bytes
-            
-        Returns:
-            Tuple of (command, code, value)
+        Any failure (including cancellation mid-read) drops the connection,
+        since the request/answer framing can no longer be trusted.
         """
-        response = data.decode("ascii").strip()
-        # Format: *SAPOWR0000000000000001
-        if len(response) < 8:
-            raise ValueError("Response too short")
-        
-        command = response[:3]  # *SA
-        code = response[3:7]  # POWR
-        value = response[7:].rstrip("#")  # Remove padding
-        
-        return command, code, value
+        reader, writer = connection
+        try:
+            writer.write(packet)
+            await writer.drain()
+
+            while True:
+                # Read exactly one packet; a short read raises IncompleteReadError
+                data = await asyncio.wait_for(
+                    reader.readexactly(_SIP_PACKET_SIZE),
+                    timeout=self.timeout,
+                )
+                if not data.startswith(_SIP_NOTIFY):
+                    return data
+        except BaseException:
+            self._connections.pop(ip, None)
+            writer.close()
+            raise
 
     async def get_power_status(self, ip: str, psk: str) -> PowerStatus:
         """Get TV power status via Simple IP Control.
@@ -199,50 +372,24 @@ class BraviaSimpleIPAdapter:
         Returns:
             "active" if TV is on, "standby" if off, "error" on failure
         """
-        for attempt in range(self.max_retries):
-            try:
-                # Open TCP connection
-                reader, writer = await asyncio.wait_for(
-                    asyncio.open_connection(ip, self.port),
-                    timeout=self.timeout,
-                )
-                
-                try:
-                    # Send enquiry packet: *SEPOWR#################\n
-                    packet = self._build_packet("*SE", "POWR", "")
-                    writer.write(packet)
-                    await writer.drain()
-                    
-                    # Read response
-                    data = await asyncio.wait_for(
-                        reader.read(1024),
-                        timeout=self.timeout,
-                    )
-                    
-                    # Parse response: *SAPOWR0000000000000001\n
-                    command, code, value = self._parse_response(data)
-                    
-                    if command == "*SA" and code == "POWR":
-                        # Value: 0000000000000001 = ON, 0000000000000000 = OFF
-                        if value.endswith("1"):
-                            return "active"
-                        elif value.endswith("0"):
-                            return "standby"
-                    
-                    raise ValueError(f"Invalid response: {data}")
-                    
-                finally:
-                    writer.close()
-                    await writer.wait_closed()
-                    
-            except Exception as e:
-                logger.warning(
-                    f"Simple IP get_power_status attempt {attempt + 1}/{self.max_retries} failed for {ip}: {e}"
-                )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2**attempt)
-                    
-        return "error"
+        async def attempt() -> PowerStatus:
+            # Send enquiry packet: *SEPOWR################\n
+            data = await self._exchange(ip, _SIP_QUERY)
+
+            # Response: *SAPOWR0000000000000001\n (ON) / *SAPOWR0000000000000000\n (OFF)
+            if data.startswith(_SIP_ANSWER):
+                state = data[_SIP_STATE_OFFSET]
+                if state == 0x31:  # "1"
+                    return "active"
+                if state == 0x30:  # "0"
+                    return "standby"
+
+            raise ValueError(f"Invalid response: {data}")
+
+        try:
+            return await _retry(attempt, f"Simple IP get_power_status for {ip}", self.max_retries, self.total_timeout)
+        except Exception:
+            return "error"
 
     async def set_power(self, ip: str, psk: str, on: bool) -> bool:
         """Set TV power state via Simple IP Control.
@@ -255,48 +402,21 @@ class BraviaSimpleIPAdapter:
         Returns:
             True if command succeeded, False on failure
         """
-        for attempt in range(self.max_retries):
-            try:
-                # Open TCP connection
-                reader, writer = await asyncio.wait_for(
-                    asyncio.open_connection(ip, self.port),
-                    timeout=self.timeout,
-                )
-                
-                try:
-                    # Send command packet: *SCPOWR0000000000000001\n (on) or *SCPOWR0000000000000000\n (off)
-                    value = "0000000000000001" if on else "0000000000000000"
-                    packet = self._build_packet("*SC", "POWR", value)
-                    writer.write(packet)
-                    await writer.drain()
-                    
-                    # Read acknowledgment
-                    data = await asyncio.wait_for(
-                        reader.read(1024),
-                        timeout=self.timeout,
-                    )
-                    
-                    # Parse response: *SAPOWR0000000000000001\n (echoes new state)
-                    command, code, response_value = self._parse_response(data)
-                    
-                    if command == "*SA" and code == "POWR":
-                        logger.info(f"Simple IP set_power({on}) succeeded for {ip}")
-                        return True
-                    
-                    raise ValueError(f"Invalid response: {data}")
-                    
-                finally:
-                    writer.close()
-                    await writer.wait_closed()
-                    
-            except Exception as e:
-                logger.warning(
-                    f"Simple IP set_power attempt {attempt + 1}/{self.max_retries} failed for {ip}: {e}"
-                )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2**attempt)
-                    
-        return False
+        async def attempt() -> bool:
+            # Send command packet: *SCPOWR0000000000000001\n (on) or *SCPOWR0000000000000000\n (off)
+            data = await self._exchange(ip, _SIP_SET_POWER[bool(on)])
+
+            # Response: *SAPOWR0000000000000000\n (acknowledges the command)
+            if data.startswith(_SIP_ANSWER):
+                logger.info(f"Simple IP set_power({on}) succeeded for {ip}")
+                return True
+
+            raise ValueError(f"Invalid response: {data}")
+
+        try:
+            return await _retry(attempt, f"Simple IP set_power for {ip}", self.max_retries, self.total_timeout)
+        except Exception:
+            return False
 
 
 class BraviaAdapter:
@@ -306,10 +426,34 @@ class BraviaAdapter:
     handles protocol selection and fallback.
     """
 
-    def __init__(self):
-        """Initialize facade adapter with REST and Simple IP adapters."""
-        self.rest = BraviaRestAdapter()
+    __slots__ = ("rest", "simple_ip", "_status_ttl", "_hedge_delay", "_status_cache", "_inflight")
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        status_ttl: float = STATUS_CACHE_TTL,
+        hedge_delay: float = STATUS_HEDGE_DELAY,
+    ):
+        """Initialize facade adapter with REST and Simple IP adapters.
+        
+        Args:
+            client: Shared pooled HTTP client for the REST adapter
+            status_ttl: Seconds a power status is served from cache (0 disables caching)
+            hedge_delay: Seconds a status query waits on REST before also trying Simple IP
+        """
+        self.rest = BraviaRestAdapter(client=client)
         self.simple_ip = BraviaSimpleIPAdapter()
+        self._status_ttl = status_ttl
+        self._hedge_delay = hedge_delay
+        # (ip, psk) -> (time.monotonic() when stored, status)
+        self._status_cache: dict[tuple[str, str | None], tuple[float, PowerStatus]] = {}
+        # (ip, psk) -> status query currently running for that TV
+        self._inflight: dict[tuple[str, str | None], asyncio.Future[PowerStatus]] = {}
+
+    async def aclose(self) -> None:
+        """Release the connections held by the protocol adapters."""
+        await self.rest.aclose()
+        await self.simple_ip.aclose()
 
     async def get_power_status(self, ip: str, psk: str | None) -> PowerStatus:
         """Get TV power status (tries REST first, falls back to Simple IP).
@@ -321,26 +465,74 @@ class BraviaAdapter:
         Returns:
             "active" if TV is on, "standby" if off, "error" on failure
         """
-        if psk:
-            logger.debug(f"Trying REST API for {ip}")
-            status = await self.rest.get_power_status(ip, psk)
-            
-            if status != "error":
-                logger.info(f"REST API succeeded for {ip}: {status}")
-                return status
-            
-            logger.info(f"REST API failed for {ip}, falling back to Simple IP")
-        else:
+        key = (ip, psk)
+        cached = self._status_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._status_ttl:
+            logger.debug(f"Serving cached power status for {ip}: {cached[1]}")
+            return cached[1]
+        
+        # Concurrent callers for the same TV share one in-flight query; shield()
+        # keeps a cancelled caller from cancelling it for the others
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh_power_status(ip, psk))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _refresh_power_status(self, ip: str, psk: str | None) -> PowerStatus:
+        """Query the TV and store the result in the status cache."""
+        status = await self._query_power_status(ip, psk)
+        # Errors are not cached so the next poll retries the TV
+        if status != "error":
+            self._status_cache[(ip, psk)] = (time.monotonic(), status)
+        return status
+
+    async def _query_power_status(self, ip: str, psk: str | None) -> PowerStatus:
+        """Query the TV for its power status, hedging a slow REST call with Simple IP.
+        
+        Simple IP is only tried once REST has failed or not answered within the
+        hedge delay, so a TV answering REST never sees Simple IP traffic (nor
+        has its persistent Simple IP connection torn down by a lost race).
+        From then on the first successful answer wins, REST on a tie, and the
+        other query is cancelled.
+        """
+        if not psk:
             logger.debug(f"No PSK provided for {ip}, using Simple IP only")
+            status = await self.simple_ip.get_power_status(ip, "")
+            if status != "error":
+                logger.info(f"Simple IP succeeded for {ip}: {status}")
+            else:
+                logger.error(f"Simple IP failed for {ip}")
+            return status
         
-        status = await self.simple_ip.get_power_status(ip, psk or "")
+        logger.debug(f"Querying REST API for {ip}")
+        rest_task = asyncio.ensure_future(self.rest.get_power_status(ip, psk))
+        try:
+            done, pending = await asyncio.wait({rest_task}, timeout=self._hedge_delay)
+        except BaseException:
+            rest_task.cancel()
+            raise
+        if rest_task in done and rest_task.result() != "error":
+            logger.info(f"REST API succeeded for {ip}: {rest_task.result()}")
+            return rest_task.result()
         
-        if status != "error":
-            logger.info(f"Simple IP succeeded for {ip}: {status}")
-        else:
-            logger.error(f"Both protocols failed for {ip}" if psk else f"Simple IP failed for {ip}")
+        logger.debug(f"REST API failed or slow for {ip}, also querying Simple IP")
+        simple_ip_task = asyncio.ensure_future(self.simple_ip.get_power_status(ip, psk))
+        pending.add(simple_ip_task)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task, protocol in ((rest_task, "REST API"), (simple_ip_task, "Simple IP")):
+                    if task in done and task.result() != "error":
+                        logger.info(f"{protocol} succeeded for {ip}: {task.result()}")
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
         
-        return status
+        logger.error(f"Both protocols failed for {ip}")
+        return "error"
 
     async def set_power(self, ip: str, psk: str | None, on: bool) -> bool:
         """Set TV power state (tries REST first, falls back to Simple IP).
@@ -353,6 +545,17 @@ class BraviaAdapter:
         Returns:
             True if command succeeded, False on failure
         """
+        success = await self._send_power(ip, psk, on)
+        key = (ip, psk)
+        if success:
+            # Write-through: the TV is now in the state we just set
+            self._status_cache[key] = (time.monotonic(), "active" if on else "standby")
+        else:
+            self._status_cache.pop(key, None)
+        return success
+
+    async def _send_power(self, ip: str, psk: str | None, on: bool) -> bool:
+        """Send the power command, REST first with Simple IP fallback."""
         if psk:
             logger.debug(f"Trying REST API set_power({on}) for {ip}")
             success = await self.rest.set_power(ip, psk, on)
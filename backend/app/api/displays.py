@@ -11,7 +11,7 @@ Endpoints:
 - GET /api/v1/displays/{id}/status - Get display power status
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request, status, UploadFile, File
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from typing import List
@@ -36,9 +36,13 @@ from app.adapters.bravia import BraviaAdapter
 router = APIRouter(prefix="/displays", tags=["displays"])
 
 
-def get_bravia_adapter():
-    """Dependency injection for BraviaAdapter."""
-    return BraviaAdapter()
+def get_bravia_adapter(request: Request):
+    """Dependency injection for BraviaAdapter (the app's shared adapter and HTTP client)."""
+    adapter = getattr(request.app.state, "bravia", None)
+    if adapter is None:
+        # Created and closed by the lifespan; a per-request adapter would leak its client
+        raise RuntimeError("BraviaAdapter not initialized: app lifespan has not run")
+    return adapter
 
 
 @router.get("", response_model=List[DisplayResponse])
@@ -2,7 +2,7 @@
 Group API router - CRUD operations and bulk power control for groups.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from typing import List
@@ -20,9 +20,13 @@ from app.adapters.bravia import BraviaAdapter
 router = APIRouter(prefix="/groups", tags=["groups"])
 
 
-def get_bravia_adapter():
-    """Dependency injection for BraviaAdapter."""
-    return BraviaAdapter()
+def get_bravia_adapter(request: Request):
+    """Dependency injection for BraviaAdapter (the app's shared adapter and HTTP client)."""
+    adapter = getattr(request.app.state, "bravia", None)
+    if adapter is None:
+        # Created and closed by the lifespan; a per-request adapter would leak its client
+        raise RuntimeError("BraviaAdapter not initialized: app lifespan has not run")
+    return adapter
 
 
 @router.get("", response_model=List[GroupResponse])
@@ -3,17 +3,27 @@ Database configuration and session management.
 Sets up SQLAlchemy ORM with SQLite database.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
 import os
 
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ldpm.db")
 
-# Create engine
+
+def _is_sqlite_memory(url: str) -> bool:
+    """True for in-memory SQLite URLs (e.g. "sqlite://", used by the test suite)."""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+# Create engine; an in-memory database only lives as long as its connection,
+# so it gets a single connection shared by every session
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    **({"poolclass": StaticPool} if _is_sqlite_memory(DATABASE_URL) else {}),
 )
 
 # Create session factory
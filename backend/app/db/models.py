@@ -9,10 +9,12 @@ Models:
 - ScheduleExecution: Execution log for schedule runs
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, JSON, Text, event, text
+from sqlalchemy.orm import relationship, reconstructor, validates
+from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
 from app.db.database import Base
+from app.services.cron import parse_cron
 
 
 class Display(Base):
@@ -84,7 +86,8 @@ class DisplayGroup(Base):
     __tablename__ = "display_groups"
     
     display_id = Column(Integer, ForeignKey("displays.id", ondelete="CASCADE"), primary_key=True)
-    group_id = Column(Integer, ForeignKey("groups.id", ondelete="CASCADE"), primary_key=True)
+    # display_id leads the primary key; group_id needs its own index for group lookups
+    group_id = Column(Integer, ForeignKey("groups.id", ondelete="CASCADE"), primary_key=True, index=True)
     
     # Relationships
     display = relationship("Display", back_populates="display_groups")
@@ -160,10 +163,53 @@ class Schedule(Base):
     schedule_groups = relationship("ScheduleGroup", back_populates="schedule", cascade="all, delete-orphan")
     executions = relationship("ScheduleExecution", back_populates="schedule", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        # Partial index: schedule loading/reloading only ever looks up enabled
+        # rows. The SQLite predicate must match the `enabled.is_(True)` filter
+        # verbatim (IS 1) for the planner to use it
+        Index(
+            "ix_schedule_enabled_true",
+            "enabled",
+            postgresql_where=text("enabled = true"),
+            sqlite_where=text("enabled IS 1"),
+        ),
+    )
+    
+    # Parsed CronTrigger for cron_expression (not mapped) - built lazily by `trigger`
+    _trigger_cache = None
+    
+    @reconstructor
+    def _init_on_load(self):
+        self._trigger_cache = None
+    
+    @validates("cron_expression")
+    def _validate_cron_expression(self, key, value):
+        self._trigger_cache = None
+        return value
+    
+    @property
+    def trigger(self) -> CronTrigger:
+        """
+        APScheduler trigger for cron_expression, parsed once per instance.
+        
+        Raises:
+            ValueError: If cron_expression is invalid
+        """
+        if self._trigger_cache is None:
+            self._trigger_cache = parse_cron(self.cron_expression)
+        return self._trigger_cache
+    
     def __repr__(self):
         return f"<Schedule(id={self.id}, name={self.name}, action={self.action}, enabled={self.enabled})>"
 
 
+@event.listens_for(Schedule, "expire")
+def _clear_schedule_trigger(target, attrs):
+    """Drop the cached trigger when cron_expression is expired (reloaded on next access)."""
+    if attrs is None or "cron_expression" in attrs:
+        target._trigger_cache = None
+
+
 class ScheduleExecution(Base):
     """
     ScheduleExecution model - execution log for schedule runs.
@@ -3,10 +3,12 @@ import os
 import secrets
 import logging
 
+import httpx
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 
+from app.adapters.bravia import BraviaAdapter
 from app.api import displays, groups, schedules, energy, activity
 from app.services.scheduler import SchedulerService
 from app.db.database import SessionLocal
@@ -54,14 +56,21 @@ async def lifespan(app: FastAPI):
     FastAPI lifespan context manager.
     
     Handles startup and shutdown events:
-    - Startup: Initialize and start scheduler
-    - Shutdown: Stop scheduler
+    - Startup: Open shared HTTP client and BRAVIA adapter, initialize and start scheduler
+    - Shutdown: Stop scheduler, close TV connections and shared HTTP client
     """
     logger.info("=== APPLICATION STARTUP ===")
+    # One pooled client for all TV REST calls so keep-alive connections are reused
+    app.state.http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    )
+    # Shared adapter so its power status cache survives across requests
+    app.state.bravia = BraviaAdapter(client=app.state.http_client)
     db = SessionLocal()
     try:
         logger.info("Initializing scheduler service...")
-        scheduler = SchedulerService(db_session=db)
+        # Shares the API's adapter: one set of TV connections, closed below
+        scheduler = SchedulerService(db_session=db, adapter=app.state.bravia)
         scheduler.load_schedules_from_db()
         scheduler.start()
         logger.info("Scheduler started successfully")
@@ -74,6 +83,8 @@ async def lifespan(app: FastAPI):
         if hasattr(app.state, "scheduler"):
             app.state.scheduler.stop()
         db.close()
+        await app.state.bravia.aclose()
+        await app.state.http_client.aclose()
 
 
 app = FastAPI(
@@ -0,0 +1,38 @@
+"""
+Cron expression parsing for LDPM schedules.
+
+Kept separate from the scheduler service so the ORM models can build
+triggers without importing the scheduler (which imports the models).
+"""
+
+from functools import lru_cache
+
+from apscheduler.triggers.cron import CronTrigger
+
+
+@lru_cache(maxsize=512)
+def parse_cron(cron_expression: str) -> CronTrigger:
+    """
+    Parse cron expression into APScheduler CronTrigger.
+
+    Results are memoized per expression: schedules sharing an expression share
+    one trigger, which is safe as APScheduler never mutates a trigger.
+
+    Args:
+        cron_expression: Cron format string (e.g., "0 7 * * MON-FRI")
+
+    Returns:
+        CronTrigger instance
+
+    Raises:
+        ValueError: If cron expression is invalid
+    """
+    if not cron_expression or not cron_expression.strip():
+        raise ValueError("Invalid cron expression: empty string")
+
+    try:
+        # "minute hour day month day_of_week"; APScheduler's own parser is the
+        # only validator, so anything it can schedule is accepted
+        return CronTrigger.from_crontab(cron_expression.strip())
+    except Exception as e:
+        raise ValueError(f"Invalid cron expression '{cron_expression}': {e}")
@@ -8,19 +8,28 @@ Manages APScheduler-based power scheduling system that:
 - Supports both display-level and group-level schedules
 """
 
+import asyncio
 import logging
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only, selectinload
 
-from app.db.models import Display, Schedule, ScheduleExecution, PowerLog
+from app.db.models import Schedule, ScheduleExecution, PowerLog
 from app.adapters.bravia import BraviaAdapter
+from app.services.cron import parse_cron
 
 logger = logging.getLogger(__name__)
 
+JOB_ID_PREFIX = "schedule_"
+SCHEDULE_BATCH_SIZE = 200
+# Most runs' execution logs written with one commit by the write-behind log writer
+EXECUTION_LOG_BATCH_SIZE = 128
+
 
 class SchedulerService:
     """
@@ -30,16 +39,30 @@ class SchedulerService:
     Logs all execution results to the ScheduleExecution table.
     """
     
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: Session,
+        scheduler_factory: Callable[[], AsyncIOScheduler] = AsyncIOScheduler,
+        adapter: Optional[BraviaAdapter] = None,
+    ):
         """
         Initialize scheduler service.
         
         Args:
             db_session: SQLAlchemy database session
+            scheduler_factory: Builds the job scheduler (tests pass an in-memory fake)
+            adapter: Shared BRAVIA adapter, closed by its owner (None = create one closed by stop())
         """
         self.db = db_session
-        self.scheduler = AsyncIOScheduler()
-        self.adapter = BraviaAdapter()
+        self.scheduler = scheduler_factory()
+        self.adapter = adapter if adapter is not None else BraviaAdapter()
+        self._owns_adapter = adapter is None
+        # Cron expression each job was last (re)scheduled with, keyed by job id
+        self._job_crons: Dict[str, str] = {}
+        # Write-behind execution log: each queued item is one run's rows.
+        # Only set while started on an event loop; otherwise runs commit inline.
+        self._exec_log_queue: Optional[asyncio.Queue] = None
+        self._exec_log_writer: Optional[asyncio.Task] = None
         
         logger.info("SchedulerService initialized")
     
@@ -56,31 +79,87 @@ class SchedulerService:
         Raises:
             ValueError: If cron expression is invalid
         """
-        if not cron_expression or not cron_expression.strip():
-            raise ValueError("Invalid cron expression: empty string")
+        return parse_cron(cron_expression)
+    
+    @staticmethod
+    def _job_id(schedule_id: int) -> str:
+        """APScheduler job id for a schedule."""
+        return f"{JOB_ID_PREFIX}{schedule_id}"
+    
+    def _query_enabled_schedules(self, eager_targets: bool = False) -> Iterable[Schedule]:
+        """
+        Query all enabled schedules.
+        
+        Only the columns needed to build jobs are loaded, and rows are streamed
+        in batches so a large schedules table does not spike memory on reload.
+        
+        Args:
+            eager_targets: Every schedule's target summary will be logged; load
+                the target rows with one extra SELECT per batch instead of two
+                per schedule (skipped when INFO logging is off)
+        """
+        query = (
+            self.db.query(Schedule)
+            .options(load_only(Schedule.id, Schedule.name, Schedule.cron_expression, Schedule.action))
+            .filter(Schedule.enabled.is_(True))
+        )
+        if eager_targets and logger.isEnabledFor(logging.INFO):
+            query = query.options(
+                selectinload(Schedule.schedule_displays),
+                selectinload(Schedule.schedule_groups),
+            )
+        return query.yield_per(SCHEDULE_BATCH_SIZE)
+    
+    @contextmanager
+    def _batched_job_changes(self) -> Iterator[None]:
+        """
+        Apply several job changes with a single scheduler wakeup.
         
+        A running scheduler wakes up on every added or rescheduled job; pausing
+        it for the batch defers that to one wakeup on resume.
+        """
+        if self.scheduler.state != STATE_RUNNING:
+            yield
+            return
+        
+        self.scheduler.pause()
         try:
-            # Parse cron expression: "minute hour day month day_of_week"
-            parts = cron_expression.strip().split()
-            
-            if len(parts) != 5:
-                raise ValueError(f"Invalid cron expression: expected 5 fields, got {len(parts)}")
-            
-            minute, hour, day, month, day_of_week = parts
+            yield
+        finally:
+            self.scheduler.resume()
+    
+    def _add_schedule_job(self, schedule: Schedule, trigger: CronTrigger) -> None:
+        """Add (or replace) the APScheduler job for a schedule."""
+        job_id = self._job_id(schedule.id)
+        self.scheduler.add_job(
+            self.execute_schedule,
+            trigger=trigger,
+            id=job_id,
+            args=[schedule.id],
+            replace_existing=True
+        )
+        self._job_crons[job_id] = schedule.cron_expression
+        
+        # Target summary touches both relationships - only build it if it will be logged
+        if logger.isEnabledFor(logging.INFO):
+            display_count = len(schedule.schedule_displays)
+            group_count = len(schedule.schedule_groups)
+            targets = []
+            if display_count > 0:
+                targets.append(f"{display_count} display(s)")
+            if group_count > 0:
+                targets.append(f"{group_count} group(s)")
+            target_str = " + ".join(targets)
             
-            # Create CronTrigger
-            trigger = CronTrigger(
-                minute=minute,
-                hour=hour,
-                day=day,
-                month=month,
-                day_of_week=day_of_week
+            logger.info(
+                "Loaded schedule '%s' (id=%s): %s %s at %s",
+                schedule.name, schedule.id, schedule.action, target_str, schedule.cron_expression
             )
-            
-            return trigger
-            
-        except Exception as e:
-            raise ValueError(f"Invalid cron expression '{cron_expression}': {e}")
+    
+    def _remove_schedule_job(self, job_id: str) -> None:
+        """Remove a schedule's APScheduler job."""
+        self.scheduler.remove_job(job_id)
+        self._job_crons.pop(job_id, None)
     
     def load_schedules_from_db(self) -> None:
         """
@@ -91,43 +170,27 @@ class SchedulerService:
         """
         logger.info("Loading schedules from database")
         
-        # Query all enabled schedules
-        schedules = self.db.query(Schedule).filter(Schedule.enabled == True).all()  # noqa: E712
-        
-        logger.info(f"Found {len(schedules)} enabled schedule(s)")
+        # Cheap probe first: nothing to stream (or eager-load) without enabled schedules
+        if self.db.query(Schedule.id).filter(Schedule.enabled.is_(True)).limit(1).scalar() is None:
+            logger.info("Found 0 enabled schedule(s)")
+            return
         
-        for schedule in schedules:
-            try:
-                # Parse cron expression
-                trigger = self.parse_cron(schedule.cron_expression)
-                
-                self.scheduler.add_job(
-                    self.execute_schedule,
-                    trigger=trigger,
-                    id=f"schedule_{schedule.id}",
-                    args=[schedule.id],
-                    replace_existing=True
-                )
-                
-                display_count = len(schedule.schedule_displays)
-                group_count = len(schedule.schedule_groups)
-                targets = []
-                if display_count > 0:
-                    targets.append(f"{display_count} display(s)")
-                if group_count > 0:
-                    targets.append(f"{group_count} group(s)")
-                target_str = " + ".join(targets)
-                
-                logger.info(
-                    f"Loaded schedule '{schedule.name}' (id={schedule.id}): "
-                    f"{schedule.action} {target_str} at {schedule.cron_expression}"
-                )
+        found = 0
+        with self._batched_job_changes():
+            for schedule in self._query_enabled_schedules(eager_targets=True):
+                found += 1
+                try:
+                    # Parsed once per Schedule instance (see Schedule.trigger)
+                    trigger = schedule.trigger
+                except ValueError as e:
+                    logger.error(
+                        f"Failed to load schedule '{schedule.name}' (id={schedule.id}): {e}"
+                    )
+                    continue
                 
-            except ValueError as e:
-                logger.error(
-                    f"Failed to load schedule '{schedule.name}' (id={schedule.id}): {e}"
-                )
-                continue
+                self._add_schedule_job(schedule, trigger)
+        
+        logger.info("Found %d enabled schedule(s)", found)
     
     async def execute_schedule(self, schedule_id: int) -> None:
         """
@@ -139,7 +202,10 @@ class SchedulerService:
         Args:
             schedule_id: ID of schedule to execute
         """
-        logger.info(f"Executing schedule {schedule_id}")
+        logger.info("Executing schedule %s", schedule_id)
+        
+        # One timestamp for the whole run: every PowerLog and the ScheduleExecution share it
+        executed_at = datetime.utcnow()
         
         schedule = self.db.query(Schedule).filter(Schedule.id == schedule_id).first()
         
@@ -169,39 +235,46 @@ class SchedulerService:
         
         failed_displays = []
         success_count = 0
+        # PowerLogs and the ScheduleExecution are added in one batch with one commit
+        rows = []
         
         try:
             for display in displays_to_control:
                 logger.info(
-                    f"Setting power={'ON' if power_on else 'OFF'} for display "
-                    f"'{display.name}' ({display.ip_address})"
+                    "Setting power=%s for display '%s' (%s)",
+                    "ON" if power_on else "OFF", display.name, display.ip_address
                 )
-                
-                try:
-                    result = await self.adapter.set_power(display.ip_address, display.psk, power_on)
-                    
-                    if result:
-                        power_log = PowerLog(
-                            display_id=display.id,
-                            action="on" if power_on else "off",
-                            timestamp=datetime.utcnow(),
-                            source="schedule"
-                        )
-                        self.db.add(power_log)
-                        success_count += 1
-                    else:
-                        failed_displays.append(display.name)
-                        logger.error(f"Failed to execute power command on display '{display.name}'")
-                except Exception as e:
+            
+            # Displays are independent - send all commands at once instead of one round-trip after another
+            results = await asyncio.gather(
+                *(self.adapter.set_power(display.ip_address, display.psk, power_on) for display in displays_to_control),
+                return_exceptions=True
+            )
+            
+            for display, result in zip(displays_to_control, results):
+                if isinstance(result, Exception):
+                    failed_displays.append(display.name)
+                    logger.error(f"Exception controlling display '{display.name}': {result}")
+                elif isinstance(result, BaseException):
+                    raise result
+                elif result:
+                    rows.append(PowerLog(
+                        display_id=display.id,
+                        action="on" if power_on else "off",
+                        timestamp=executed_at,
+                        source="schedule"
+                    ))
+                    success_count += 1
+                else:
                     failed_displays.append(display.name)
-                    logger.error(f"Exception controlling display '{display.name}': {e}")
+                    logger.error(f"Failed to execute power command on display '{display.name}'")
             
             success = len(failed_displays) == 0
             error_message = None if success else f"Failed on {len(failed_displays)} display(s): {', '.join(failed_displays)}"
             
             logger.info(
-                f"Schedule {schedule_id} execution complete: "
-                f"{success_count}/{len(displays_to_control)} succeeded"
+                "Schedule %s execution complete: %d/%d succeeded",
+                schedule_id, success_count, len(displays_to_control)
             )
         
         except Exception as e:
@@ -210,47 +283,183 @@ class SchedulerService:
             logger.error(f"Exception during schedule {schedule_id} execution: {e}")
         
         # Log execution to database
-        execution = ScheduleExecution(
+        rows.append(ScheduleExecution(
             schedule_id=schedule_id,
-            executed_at=datetime.utcnow(),
+            executed_at=executed_at,
             success=success,
             error_message=error_message
-        )
+        ))
         
-        self.db.add(execution)
-        self.db.commit()
+        if self._exec_log_queue is not None:
+            # Committed by _drain_exec_log, batched with other runs' rows
+            self._exec_log_queue.put_nowait(rows)
+        else:
+            self._write_exec_log(rows)
         
         logger.info(
-            f"Logged execution for schedule {schedule_id}: "
-            f"success={success}, error={error_message}"
+            "Logged execution for schedule %s: success=%s, error=%s",
+            schedule_id, success, error_message
         )
     
+    def _write_exec_log(self, rows: List[object]) -> None:
+        """Add execution log rows (PowerLogs and ScheduleExecutions) with one commit."""
+        self.db.add_all(rows)
+        self.db.commit()
+    
+    def _write_exec_log_runs(self, runs: List[List[object]]) -> None:
+        """
+        Write several runs' execution logs with one commit.
+        
+        If the batch fails, it is rolled back and each run is retried with its
+        own commit, so one bad run does not cost the others their logs. Runs
+        that still fail are logged with their schedule id and dropped.
+        """
+        try:
+            self._write_exec_log([row for run in runs for row in run])
+            return
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"Failed to write execution log for {len(runs)} run(s), retrying one at a time: {e}")
+        
+        for run in runs:
+            try:
+                self._write_exec_log(run)
+            except Exception as e:
+                self.db.rollback()
+                # Each run's rows end with its ScheduleExecution
+                logger.error(
+                    f"Dropped execution log of schedule {run[-1].schedule_id} ({len(run)} row(s)): {e}"
+                )
+    
+    async def _drain_exec_log(self) -> None:
+        """
+        Write queued execution logs until cancelled.
+        
+        Waits for one run's rows, then takes whatever else is already queued (up
+        to EXECUTION_LOG_BATCH_SIZE runs) so concurrent runs share one commit.
+        """
+        queue = self._exec_log_queue
+        while True:
+            runs = [await queue.get()]
+            while len(runs) < EXECUTION_LOG_BATCH_SIZE and not queue.empty():
+                runs.append(queue.get_nowait())
+            
+            try:
+                self._write_exec_log_runs(runs)
+            finally:
+                for _ in runs:
+                    queue.task_done()
+    
+    def _start_exec_log_writer(self) -> None:
+        """Start the write-behind log writer on the running event loop, if any."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("No running event loop, execution logs are written inline")
+            return
+        
+        self._exec_log_queue = asyncio.Queue()
+        self._exec_log_writer = loop.create_task(self._drain_exec_log())
+    
+    def _stop_exec_log_writer(self) -> None:
+        """Stop the log writer and write whatever it had not picked up yet."""
+        if self._exec_log_writer is None:
+            return
+        
+        # The writer only yields while waiting on the queue, so cancelling it
+        # never interrupts a batch between add_all and commit
+        if not self._exec_log_writer.get_loop().is_closed():
+            self._exec_log_writer.cancel()
+        
+        pending: List[List[object]] = []
+        while not self._exec_log_queue.empty():
+            pending.append(self._exec_log_queue.get_nowait())
+        self._exec_log_queue = None
+        self._exec_log_writer = None
+        
+        if pending:
+            self._write_exec_log_runs(pending)
+    
+    def _close_owned_adapter(self) -> None:
+        """Schedule aclose() of an adapter this service created, on the running event loop."""
+        if not self._owns_adapter:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to run aclose() on; connections die with the loop that opened them
+            return
+        
+        self._owns_adapter = False
+        loop.create_task(self.adapter.aclose())
+    
     def reload_schedules(self) -> None:
         """
         Reload schedules from database.
         
-        Removes all existing jobs and reloads from database.
+        Diffs the enabled schedules against the scheduler's current jobs and
+        only adds, reschedules or removes the jobs that changed; unchanged
+        schedules keep their job and next fire time.
         Useful when schedules are modified through the API.
         """
         logger.info("Reloading schedules")
         
-        # Remove all existing jobs
-        self.scheduler.remove_all_jobs()
+        desired: Dict[str, Schedule] = {
+            self._job_id(schedule.id): schedule for schedule in self._query_enabled_schedules()
+        }
         
-        # Reload from database
-        self.load_schedules_from_db()
+        current = {
+            job.id: job for job in self.scheduler.get_jobs()
+            if job.id.startswith(JOB_ID_PREFIX)
+        }
+        
+        stale = current.keys() - desired.keys()
+        added = rescheduled = removed = 0
+        with self._batched_job_changes():
+            for job_id in stale:
+                self._remove_schedule_job(job_id)
+                removed += 1
+            
+            for job_id, schedule in desired.items():
+                # Unchanged schedules keep their job; their cron is not even reparsed
+                if job_id in current and self._job_crons.get(job_id) == schedule.cron_expression:
+                    continue
+                
+                try:
+                    trigger = schedule.trigger
+                except ValueError as e:
+                    logger.error(
+                        f"Failed to load schedule '{schedule.name}' (id={schedule.id}): {e}"
+                    )
+                    if job_id in current:
+                        self._remove_schedule_job(job_id)
+                        removed += 1
+                    continue
+                
+                if job_id not in current:
+                    self._add_schedule_job(schedule, trigger)
+                    added += 1
+                else:
+                    self.scheduler.reschedule_job(job_id, trigger=trigger)
+                    self._job_crons[job_id] = schedule.cron_expression
+                    rescheduled += 1
         
-        logger.info("Schedules reloaded")
+        logger.info(
+            "Schedules reloaded: %d added, %d rescheduled, %d removed",
+            added, rescheduled, removed
+        )
     
     def start(self) -> None:
         """
         Start the scheduler.
         
-        Begins executing scheduled jobs.
+        Begins executing scheduled jobs and, on a running event loop, the
+        write-behind execution log writer.
         Safe to call multiple times (idempotent).
         """
         if not self.scheduler.running:
             self.scheduler.start()
+            self._start_exec_log_writer()
             logger.info("Scheduler started")
         else:
             logger.debug("Scheduler already running")
@@ -259,14 +468,23 @@ class SchedulerService:
         """
         Stop the scheduler.
         
-        Stops executing scheduled jobs.
+        Stops executing scheduled jobs, flushes queued execution logs and
+        closes the BRAVIA adapter if the service created it.
         Safe to call multiple times (idempotent).
         """
-        if self.scheduler.running:
-            try:
-                self.scheduler.shutdown(wait=False)
-                logger.info("Scheduler stopped")
-            except RuntimeError:
-                logger.debug("Event loop closed, scheduler already stopped")
-        else:
+        self._stop_exec_log_writer()
+        self._close_owned_adapter()
+        
+        if not self.scheduler.running:
             logger.debug("Scheduler already stopped")
+            return
+
+        # Shutdown is dispatched onto the scheduler's event loop; once that loop
+        # is closed (e.g. test teardown) there is nothing left to stop
+        loop = getattr(self.scheduler, "_eventloop", None)
+        if loop is not None and loop.is_closed():
+            logger.debug("Event loop closed, scheduler already stopped")
+            return
+
+        self.scheduler.shutdown(wait=False)
+        logger.info("Scheduler stopped")
@@ -1,8 +1,29 @@
 """
 Pytest configuration and fixtures for LDPM backend tests.
 """
+import os
+
 import pytest
 
+# Point the application engine at a private in-memory database (one per test
+# process, so pytest-xdist workers cannot race) before app.db.database is
+# imported: nothing a test does through it is fsynced to ./ldpm.db
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ldpm")
+    group.addoption(
+        "--reuse-db",
+        action="store_true",
+        help="Keep the test database in .pytest_cache between runs; rebuild the schema only when models change",
+    )
+    group.addoption(
+        "--create-db",
+        action="store_true",
+        help="With --reuse-db, rebuild the kept test database schema unconditionally",
+    )
+
 
 @pytest.fixture
 def sample_display_data():
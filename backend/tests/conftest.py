@@ -0,0 +1,332 @@
+"""
+Shared test fixtures for the LDPM API tests.
+
+The API tests run against an in-memory SQLite database instead of the
+application's file-backed engine (or a kept file database with --reuse-db).
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+import httpx
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, configure_mappers, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.main import app, verify_credentials
+from app.adapters.bravia import BraviaAdapter, BraviaRestAdapter
+from app.api import displays, groups
+from app.db.database import Base, get_db
+from app.db import models  # noqa: F401  (registers tables on Base.metadata)
+
+# Resolve mapper relationships at collection time rather than inside whichever
+# test happens to run the first query
+configure_mappers()
+
+
+# One private database per pytest-xdist worker ("main" when not running distributed)
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+# Objects stay loaded after commit, so fixtures need no refresh() round-trip
+TestingSessionLocal = sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+def _create_test_engine(url: str) -> Engine:
+    """
+    SQLite engine for the test session.
+
+    StaticPool keeps the single connection alive for the whole session, and it
+    is never pinged or recycled: nothing can drop it behind our back.
+    Fixtures and the app under test share this engine, so its compiled-statement
+    cache is sized to hold the whole suite's queries.
+    """
+    engine = create_engine(
+        url,
+        poolclass=StaticPool,
+        pool_pre_ping=False,
+        pool_recycle=-1,
+        connect_args={"check_same_thread": False},
+        query_cache_size=1200,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        # pysqlite's own BEGIN handling breaks SAVEPOINT; let SQLAlchemy emit it instead
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def _schema_fingerprint(engine: Engine) -> str:
+    """Hash of the DDL the models would create, to tell when a kept database is stale."""
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(engine)))
+        for index in sorted(table.indexes, key=lambda i: str(i.name)):
+            ddl.append(str(CreateIndex(index).compile(engine)))
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
+
+
+_real_sleep = asyncio.sleep
+
+# AsyncMock construction is slow; build one and copy it per test
+_BRAVIA_TEMPLATE = AsyncMock()
+
+# Session and adapter mock of the running test; lets module-scoped clients
+# serve per-test state
+_current_db: ContextVar[Session] = ContextVar("current_db")
+_current_bravia: ContextVar[AsyncMock] = ContextVar("current_bravia")
+
+
+class BraviaMockTransport(httpx.MockTransport):
+    """
+    Answers BRAVIA REST JSON-RPC calls and records every request it receives.
+
+    Responses (or exceptions to raise) appended to ``queued`` are served first,
+    in order, before falling back to a well-formed answer.
+    """
+
+    def __init__(self, power_status: str = "active"):
+        super().__init__(self._handle)
+        self.reset(power_status)
+
+    def reset(self, power_status: str = "active") -> None:
+        """Forget recorded requests and queued responses."""
+        self.power_status = power_status
+        self.requests: list[httpx.Request] = []
+        self.queued: list[httpx.Response | Exception] = []
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.queued:
+            outcome = self.queued.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        body = json.loads(request.content)
+        if body["method"] == "getPowerStatus":
+            return httpx.Response(200, json={"result": [{"status": self.power_status}], "id": body["id"]})
+        return httpx.Response(200, json={"result": [], "id": body["id"]})
+
+
+class QueryCounter:
+    """Counts SELECTs sent to the test database; see the ``query_counter`` fixture."""
+
+    def __init__(self):
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip()[:6].upper() == "SELECT":
+            self.count += 1
+
+    @contextmanager
+    def assert_queries(self, max_count: int):
+        """Fail if the block issues more than ``max_count`` SELECTs (e.g. lazy loads per row)."""
+        start = self.count
+        yield
+        issued = self.count - start
+        assert issued <= max_count, f"expected at most {max_count} SELECT(s), got {issued}"
+
+
+def _override_get_db():
+    """get_db override yielding the current test's session."""
+    yield _current_db.get()
+
+
+def _override_get_bravia():
+    """get_bravia_adapter override returning the current test's adapter mock."""
+    return _current_bravia.get()
+
+
+def _override_verify_credentials():
+    return "test_user"
+
+
+@pytest.fixture(autouse=True)
+def sleep_delays(monkeypatch):
+    """
+    Skip retry backoff delays; still yield to the event loop like sleep(0).
+
+    Returns the list of requested delays, for tests asserting on backoff.
+    """
+    delays: list[float] = []
+
+    async def _instant(delay, result=None):
+        delays.append(delay)
+        await _real_sleep(0)
+        return result
+
+    monkeypatch.setattr(asyncio, "sleep", _instant)
+    return delays
+
+
+@pytest.fixture(scope="session")
+def engine_test(request):
+    """
+    Test database engine with the schema in place.
+
+    In-memory by default. With --reuse-db the database is kept in
+    .pytest_cache between runs and the schema is only rebuilt when the models'
+    DDL changes (or --create-db is given).
+    """
+    if not request.config.getoption("reuse_db"):
+        engine = _create_test_engine(f"sqlite:///file:ldpm_test_{WORKER_ID}?mode=memory&uri=true")
+        Base.metadata.create_all(bind=engine)
+        yield engine
+        engine.dispose()
+        return
+
+    cache_dir = request.config.rootpath / ".pytest_cache"
+    cache_dir.mkdir(exist_ok=True)
+    db_path = cache_dir / f"ldpm_test_{WORKER_ID}.db"
+    hash_path = db_path.with_suffix(".schema")
+
+    engine = _create_test_engine(f"sqlite:///{db_path}")
+    fingerprint = _schema_fingerprint(engine)
+    stale = (
+        request.config.getoption("create_db")
+        or not hash_path.exists()
+        or hash_path.read_text() != fingerprint
+    )
+    if stale:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        hash_path.write_text(fingerprint)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def db_connection(engine_test):
+    """One connection for the whole session, inside a transaction that is never committed."""
+    connection = engine_test.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    # No drop_all: the in-memory database disappears with the engine, and a
+    # --reuse-db database keeps its schema for the next run
+    connection.close()
+
+
+@pytest.fixture
+def db(db_connection):
+    """Database session isolated in a SAVEPOINT that is rolled back after each test."""
+    nested = db_connection.begin_nested()
+    # Every session-level commit/rollback works on its own SAVEPOINT inside ``nested``
+    session = TestingSessionLocal(bind=db_connection, join_transaction_mode="create_savepoint")
+    token = _current_db.set(session)
+    yield session
+    _current_db.reset(token)
+    session.close()
+    nested.rollback()
+
+
+@pytest.fixture
+def query_counter(engine_test):
+    """
+    QueryCounter for the running test, guarding against N+1 lazy loads.
+
+    Usage: ``with query_counter.assert_queries(2): ...``
+    """
+    counter = QueryCounter()
+    event.listen(engine_test, "before_cursor_execute", counter._on_execute)
+    yield counter
+    event.remove(engine_test, "before_cursor_execute", counter._on_execute)
+
+
+@pytest.fixture
+def mock_bravia_adapter():
+    """Mock BraviaAdapter for power control tests (cheap copy of a prebuilt template)."""
+    adapter_instance = copy.copy(_BRAVIA_TEMPLATE)
+    # The copy shares child mocks with the template, so clear anything a previous test configured
+    adapter_instance.reset_mock(return_value=True, side_effect=True)
+    adapter_instance.set_power.reset_mock(return_value=True, side_effect=True)
+    adapter_instance.get_power_status.reset_mock(return_value=True, side_effect=True)
+    token = _current_bravia.set(adapter_instance)
+    yield adapter_instance
+    _current_bravia.reset(token)
+
+
+@pytest_asyncio.fixture
+async def mock_bravia_transport(mock_bravia_adapter):
+    """
+    Real BraviaAdapter for the running test, with REST answered by a BraviaMockTransport.
+
+    Replaces the AsyncMock adapter so the adapter's own request/response code
+    runs; assert on ``mock_bravia_transport.requests``. Failure paths keep using
+    ``mock_bravia_adapter`` because a failed REST call falls back to Simple IP (TCP).
+    """
+    transport = BraviaMockTransport()
+
+    async def _unreachable(*args, **kwargs):
+        # Status queries start Simple IP when REST has not answered within the
+        # hedge delay; keep it off the network for that case
+        await asyncio.Event().wait()
+
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        with patch("asyncio.open_connection", side_effect=_unreachable):
+            token = _current_bravia.set(BraviaAdapter(client=http_client))
+            yield transport
+            _current_bravia.reset(token)
+
+
+@pytest.fixture(scope="module")
+def _shared_rest_transport():
+    return BraviaMockTransport()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _shared_rest_client(_shared_rest_transport):
+    async with httpx.AsyncClient(transport=_shared_rest_transport) as http_client:
+        yield http_client
+
+
+@pytest.fixture
+def rest_transport(_shared_rest_transport):
+    """The module's BraviaMockTransport, reset for the running test."""
+    _shared_rest_transport.reset()
+    return _shared_rest_transport
+
+
+@pytest.fixture
+def rest_adapter(rest_transport, _shared_rest_client):
+    """BraviaRestAdapter whose requests are answered by ``rest_transport``."""
+    return BraviaRestAdapter(client=_shared_rest_client)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client():
+    """
+    Async HTTP test client with database, BraviaAdapter and auth overrides.
+
+    Shared by every test in a module; tests using it must also request ``db``
+    and ``mock_bravia_adapter`` (see ``pytestmark`` in the API test modules).
+    """
+    app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[displays.get_bravia_adapter] = _override_get_bravia
+    app.dependency_overrides[groups.get_bravia_adapter] = _override_get_bravia
+    app.dependency_overrides[verify_credentials] = _override_verify_credentials
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _clear_dependency_overrides():
+    """Drop the dependency overrides installed by module-scoped clients."""
+    yield
+    app.dependency_overrides.clear()
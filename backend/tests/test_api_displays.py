@@ -4,50 +4,61 @@ Tests for Display CRUD operations and power control endpoints.
 Run these FIRST (should FAIL - RED phase), then implement routers to pass them (GREEN phase).
 """
 
+import json
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch
+from typing import List
+from unittest.mock import patch
 from datetime import datetime
-from app.main import app
-from app.db.models import Display, Base
-from app.db.database import engine, SessionLocal, get_db
+from app.db.models import Display
 from app.adapters.bravia import PowerStatus
+from app.schemas.display import DisplayResponse, PowerStatusResponse
+from pydantic import TypeAdapter
 
 
-@pytest.fixture
-def db():
-    """Create a fresh database session for each test."""
-    Base.metadata.create_all(bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
-    Base.metadata.drop_all(bind=engine)
+DisplayList = TypeAdapter(List[DisplayResponse])
 
+# Request paths parsed once instead of on every call
+DISPLAYS_URL = httpx.URL("/api/v1/displays")
+MISSING_DISPLAY_URL = httpx.URL("/api/v1/displays/9999")
+MISSING_DISPLAY_POWER_URL = httpx.URL("/api/v1/displays/9999/power")
+MISSING_DISPLAY_STATUS_URL = httpx.URL("/api/v1/displays/9999/status")
 
-@pytest.fixture
-def client(db, mock_bravia_adapter):
-    """Create FastAPI test client with database and BraviaAdapter dependency overrides."""
-    from app.api.displays import get_bravia_adapter
-    from app.main import verify_credentials
-    
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
-    
-    def override_get_bravia():
-        return mock_bravia_adapter
-    
-    def override_verify_credentials():
-        return "test_user"
-    
-    app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[get_bravia_adapter] = override_get_bravia
-    app.dependency_overrides[verify_credentials] = override_verify_credentials
-    with TestClient(app) as test_client:
-        yield test_client
-    app.dependency_overrides.clear()
+# Request bodies built once and shared by the tests below
+CREATE_PAYLOAD = {
+    "name": "New TV",
+    "ip_address": "192.168.1.200",
+    "psk": "new_psk_123",
+    "location": "Lobby",
+    "tags": {"type": "4k"}
+}
+CREATE_MINIMAL_PAYLOAD = {
+    "name": "Minimal TV",
+    "ip_address": "192.168.1.201",
+    "psk": "minimal_psk"
+}
+CREATE_DUPLICATE_IP_PAYLOAD = {
+    "name": "Duplicate TV",
+    "ip_address": "192.168.1.100",  # Same as sample_display
+    "psk": "duplicate_psk"
+}
+CREATE_INCOMPLETE_PAYLOAD = {"name": "Incomplete TV"}  # Missing ip_address and psk
+UPDATE_FULL_PAYLOAD = {
+    "name": "Updated TV",
+    "ip_address": "192.168.1.150",
+    "psk": "updated_psk",
+    "location": "New Location",
+    "tags": {"updated": True},
+    "status": "standby"
+}
+UPDATE_PARTIAL_PAYLOAD = {"name": "Partially Updated TV"}
+UPDATE_MISSING_PAYLOAD = {"name": "Ghost TV"}
+POWER_ON_PAYLOAD = {"on": True}
+POWER_OFF_PAYLOAD = {"on": False}
+
+# Every test gets its own rolled-back session and adapter mock (see conftest.client)
+pytestmark = pytest.mark.usefixtures("db", "mock_bravia_adapter")
 
 
 @pytest.fixture
@@ -63,38 +74,30 @@ def sample_display(db):
     )
     db.add(display)
     db.commit()
-    db.refresh(display)
     return display
 
 
-@pytest.fixture
-def mock_bravia_adapter():
-    """Mock BraviaAdapter for power control tests."""
-    adapter_instance = AsyncMock()
-    yield adapter_instance
-
-
 class TestDisplayList:
     """Tests for GET /api/v1/displays - List all displays."""
     
-    def test_list_displays_empty(self, client):
+    async def test_list_displays_empty(self, client):
         """Should return empty list when no displays exist."""
-        response = client.get("/api/v1/displays")
+        response = await client.get(DISPLAYS_URL)
         assert response.status_code == 200
-        assert response.json() == []
+        assert DisplayList.validate_json(response.content) == []
     
-    def test_list_displays_single(self, client, sample_display):
+    async def test_list_displays_single(self, client, sample_display):
         """Should return list with one display."""
-        response = client.get("/api/v1/displays")
+        response = await client.get(DISPLAYS_URL)
         assert response.status_code == 200
-        data = response.json()
+        data = DisplayList.validate_json(response.content)
         assert len(data) == 1
-        assert data[0]["id"] == sample_display.id
-        assert data[0]["name"] == "Test TV"
-        assert data[0]["ip_address"] == "192.168.1.100"
-        assert data[0]["status"] == "active"
+        assert data[0].id == sample_display.id
+        assert data[0].name == "Test TV"
+        assert data[0].ip_address == "192.168.1.100"
+        assert data[0].status == "active"
     
-    def test_list_displays_multiple(self, client, db):
+    async def test_list_displays_multiple(self, client, db):
         """Should return list with multiple displays."""
         displays = [
             Display(name=f"TV {i}", ip_address=f"192.168.1.{i}", psk=f"psk_{i}", status="active")
@@ -104,83 +107,64 @@ class TestDisplayList:
             db.add(display)
         db.commit()
         
-        response = client.get("/api/v1/displays")
+        response = await client.get(DISPLAYS_URL)
         assert response.status_code == 200
-        data = response.json()
+        data = DisplayList.validate_json(response.content)
         assert len(data) == 3
 
 
 class TestDisplayCreate:
     """Tests for POST /api/v1/displays - Create new display."""
     
-    def test_create_display_success(self, client):
+    async def test_create_display_success(self, client):
         """Should create display with valid data."""
-        payload = {
-            "name": "New TV",
-            "ip_address": "192.168.1.200",
-            "psk": "new_psk_123",
-            "location": "Lobby",
-            "tags": {"type": "4k"}
-        }
-        response = client.post("/api/v1/displays", json=payload)
+        response = await client.post(DISPLAYS_URL, json=CREATE_PAYLOAD)
         assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "New TV"
-        assert data["ip_address"] == "192.168.1.200"
-        assert data["psk"] == "new_psk_123"
-        assert data["location"] == "Lobby"
-        assert data["tags"] == {"type": "4k"}
-        assert data["status"] == "unknown"  # Default status
-        assert "id" in data
-        assert "created_at" in data
+        # Validation also checks id and created_at are present
+        data = DisplayResponse.model_validate_json(response.content)
+        assert data.name == "New TV"
+        assert data.ip_address == "192.168.1.200"
+        assert data.psk == "new_psk_123"
+        assert data.location == "Lobby"
+        assert data.tags == {"type": "4k"}
+        assert data.status == "unknown"  # Default status
     
-    def test_create_display_minimal(self, client):
+    async def test_create_display_minimal(self, client):
         """Should create display with only required fields."""
-        payload = {
-            "name": "Minimal TV",
-            "ip_address": "192.168.1.201",
-            "psk": "minimal_psk"
-        }
-        response = client.post("/api/v1/displays", json=payload)
+        response = await client.post(DISPLAYS_URL, json=CREATE_MINIMAL_PAYLOAD)
         assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Minimal TV"
-        assert data["location"] is None
-        assert data["tags"] == {}
+        data = DisplayResponse.model_validate_json(response.content)
+        assert data.name == "Minimal TV"
+        assert data.location is None
+        assert data.tags == {}
     
-    def test_create_display_duplicate_ip(self, client, sample_display):
+    async def test_create_display_duplicate_ip(self, client, sample_display):
         """Should reject display with duplicate IP address."""
-        payload = {
-            "name": "Duplicate TV",
-            "ip_address": "192.168.1.100",  # Same as sample_display
-            "psk": "duplicate_psk"
-        }
-        response = client.post("/api/v1/displays", json=payload)
+        response = await client.post(DISPLAYS_URL, json=CREATE_DUPLICATE_IP_PAYLOAD)
         assert response.status_code == 400
         assert "already exists" in response.json()["detail"].lower()
     
-    def test_create_display_missing_required_fields(self, client):
+    async def test_create_display_missing_required_fields(self, client):
         """Should reject display with missing required fields."""
-        payload = {"name": "Incomplete TV"}  # Missing ip_address and psk
-        response = client.post("/api/v1/displays", json=payload)
+        response = await client.post(DISPLAYS_URL, json=CREATE_INCOMPLETE_PAYLOAD)
         assert response.status_code == 422
 
 
 class TestDisplayGet:
     """Tests for GET /api/v1/displays/{id} - Get single display."""
     
-    def test_get_display_success(self, client, sample_display):
+    async def test_get_display_success(self, client, sample_display):
         """Should return display by ID."""
-        response = client.get(f"/api/v1/displays/{sample_display.id}")
+        response = await client.get(f"/api/v1/displays/{sample_display.id}")
         assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == sample_display.id
-        assert data["name"] == "Test TV"
-        assert data["ip_address"] == "192.168.1.100"
+        data = DisplayResponse.model_validate_json(response.content)
+        assert data.id == sample_display.id
+        assert data.name == "Test TV"
+        assert data.ip_address == "192.168.1.100"
     
-    def test_get_display_not_found(self, client):
+    async def test_get_display_not_found(self, client):
         """Should return 404 for non-existent display."""
-        response = client.get("/api/v1/displays/9999")
+        response = await client.get(MISSING_DISPLAY_URL)
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
@@ -188,148 +172,126 @@ class TestDisplayGet:
 class TestDisplayUpdate:
     """Tests for PUT /api/v1/displays/{id} - Update display."""
     
-    def test_update_display_full(self, client, sample_display):
+    async def test_update_display_full(self, client, sample_display):
         """Should update all fields of a display."""
-        payload = {
-            "name": "Updated TV",
-            "ip_address": "192.168.1.150",
-            "psk": "updated_psk",
-            "location": "New Location",
-            "tags": {"updated": True},
-            "status": "standby"
-        }
-        response = client.put(f"/api/v1/displays/{sample_display.id}", json=payload)
+        response = await client.put(f"/api/v1/displays/{sample_display.id}", json=UPDATE_FULL_PAYLOAD)
         assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == sample_display.id
-        assert data["name"] == "Updated TV"
-        assert data["ip_address"] == "192.168.1.150"
-        assert data["psk"] == "updated_psk"
-        assert data["location"] == "New Location"
-        assert data["tags"] == {"updated": True}
-        assert data["status"] == "standby"
+        data = DisplayResponse.model_validate_json(response.content)
+        assert data.id == sample_display.id
+        assert data.name == "Updated TV"
+        assert data.ip_address == "192.168.1.150"
+        assert data.psk == "updated_psk"
+        assert data.location == "New Location"
+        assert data.tags == {"updated": True}
+        assert data.status == "standby"
     
-    def test_update_display_partial(self, client, sample_display):
+    async def test_update_display_partial(self, client, sample_display):
         """Should update only specified fields."""
-        payload = {"name": "Partially Updated TV"}
-        response = client.put(f"/api/v1/displays/{sample_display.id}", json=payload)
+        response = await client.put(f"/api/v1/displays/{sample_display.id}", json=UPDATE_PARTIAL_PAYLOAD)
         assert response.status_code == 200
-        data = response.json()
-        assert data["name"] == "Partially Updated TV"
-        assert data["ip_address"] == "192.168.1.100"  # Unchanged
+        data = DisplayResponse.model_validate_json(response.content)
+        assert data.name == "Partially Updated TV"
+        assert data.ip_address == "192.168.1.100"  # Unchanged
     
-    def test_update_display_not_found(self, client):
+    async def test_update_display_not_found(self, client):
         """Should return 404 for non-existent display."""
-        payload = {"name": "Ghost TV"}
-        response = client.put("/api/v1/displays/9999", json=payload)
+        response = await client.put(MISSING_DISPLAY_URL, json=UPDATE_MISSING_PAYLOAD)
         assert response.status_code == 404
 
 
 class TestDisplayDelete:
     """Tests for DELETE /api/v1/displays/{id} - Delete display."""
     
-    def test_delete_display_success(self, client, sample_display):
+    async def test_delete_display_success(self, client, sample_display):
         """Should delete display by ID."""
-        response = client.delete(f"/api/v1/displays/{sample_display.id}")
+        response = await client.delete(f"/api/v1/displays/{sample_display.id}")
         assert response.status_code == 204
         
         # Verify display is deleted
-        get_response = client.get(f"/api/v1/displays/{sample_display.id}")
+        get_response = await client.get(f"/api/v1/displays/{sample_display.id}")
         assert get_response.status_code == 404
     
-    def test_delete_display_not_found(self, client):
+    async def test_delete_display_not_found(self, client):
         """Should return 404 for non-existent display."""
-        response = client.delete("/api/v1/displays/9999")
+        response = await client.delete(MISSING_DISPLAY_URL)
         assert response.status_code == 404
 
 
 class TestDisplayPower:
     """Tests for POST /api/v1/displays/{id}/power - Power control."""
     
-    def test_power_on_success(self, client, sample_display, mock_bravia_adapter):
+    async def test_power_on_success(self, client, sample_display, mock_bravia_transport):
         """Should power on display successfully."""
-        mock_bravia_adapter.set_power.return_value = True
-        
-        payload = {"on": True}
-        response = client.post(f"/api/v1/displays/{sample_display.id}/power", json=payload)
+        response = await client.post(f"/api/v1/displays/{sample_display.id}/power", json=POWER_ON_PAYLOAD)
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "powered on" in data["message"].lower()
         
-        # Verify BraviaAdapter was called correctly
-        mock_bravia_adapter.set_power.assert_called_once()
-        call_args = mock_bravia_adapter.set_power.call_args
-        assert call_args[0][0] == "192.168.1.100"  # IP
-        assert call_args[0][1] == "test_psk_123"  # PSK
-        assert call_args[0][2] is True  # on=True
+        # Verify the adapter sent the right command to the right TV
+        [request] = mock_bravia_transport.requests
+        assert request.url == "http://192.168.1.100/sony/system"  # IP
+        assert request.headers["X-Auth-PSK"] == "test_psk_123"  # PSK
+        assert json.loads(request.content)["params"] == [{"status": True}]  # on=True
     
-    def test_power_off_success(self, client, sample_display, mock_bravia_adapter):
+    async def test_power_off_success(self, client, sample_display, mock_bravia_transport):
         """Should power off display successfully."""
-        mock_bravia_adapter.set_power.return_value = True
-        
-        payload = {"on": False}
-        response = client.post(f"/api/v1/displays/{sample_display.id}/power", json=payload)
+        response = await client.post(f"/api/v1/displays/{sample_display.id}/power", json=POWER_OFF_PAYLOAD)
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "powered off" in data["message"].lower()
     
-    def test_power_control_failure(self, client, sample_display, mock_bravia_adapter):
+    async def test_power_control_failure(self, client, sample_display, mock_bravia_adapter):
         """Should handle power control failure."""
         mock_bravia_adapter.set_power.return_value = False
         
-        payload = {"on": True}
-        response = client.post(f"/api/v1/displays/{sample_display.id}/power", json=payload)
+        response = await client.post(f"/api/v1/displays/{sample_display.id}/power", json=POWER_ON_PAYLOAD)
         assert response.status_code == 500
         data = response.json()
         assert "failed" in data["detail"].lower()
     
-    def test_power_control_not_found(self, client, mock_bravia_adapter):
+    async def test_power_control_not_found(self, client, mock_bravia_adapter):
         """Should return 404 for non-existent display."""
-        payload = {"on": True}
-        response = client.post("/api/v1/displays/9999/power", json=payload)
+        response = await client.post(MISSING_DISPLAY_POWER_URL, json=POWER_ON_PAYLOAD)
         assert response.status_code == 404
 
 
 class TestDisplayStatus:
     """Tests for GET /api/v1/displays/{id}/status - Get power status."""
     
-    def test_get_status_active(self, client, sample_display, mock_bravia_adapter):
+    async def test_get_status_active(self, client, sample_display, mock_bravia_transport):
         """Should return active power status."""
-        mock_bravia_adapter.get_power_status.return_value = "active"
-        
-        response = client.get(f"/api/v1/displays/{sample_display.id}/status")
+        response = await client.get(f"/api/v1/displays/{sample_display.id}/status")
         assert response.status_code == 200
-        data = response.json()
-        assert data["display_id"] == sample_display.id
-        assert data["status"] == "active"
-        assert "last_checked" in data
+        # Validation also checks last_checked is present
+        data = PowerStatusResponse.model_validate_json(response.content)
+        assert data.display_id == sample_display.id
+        assert data.status == "active"
         
-        # Verify BraviaAdapter was called
-        mock_bravia_adapter.get_power_status.assert_called_once_with(
-            "192.168.1.100", "test_psk_123"
-        )
+        # Verify BraviaAdapter queried the TV
+        [request] = mock_bravia_transport.requests
+        assert request.url == "http://192.168.1.100/sony/system"
+        assert request.headers["X-Auth-PSK"] == "test_psk_123"
+        assert json.loads(request.content)["method"] == "getPowerStatus"
     
-    def test_get_status_standby(self, client, sample_display, mock_bravia_adapter):
+    async def test_get_status_standby(self, client, sample_display, mock_bravia_transport):
         """Should return standby power status."""
-        mock_bravia_adapter.get_power_status.return_value = "standby"
+        mock_bravia_transport.power_status = "standby"
         
-        response = client.get(f"/api/v1/displays/{sample_display.id}/status")
+        response = await client.get(f"/api/v1/displays/{sample_display.id}/status")
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "standby"
+        assert PowerStatusResponse.model_validate_json(response.content).status == "standby"
     
-    def test_get_status_error(self, client, sample_display, mock_bravia_adapter):
+    async def test_get_status_error(self, client, sample_display, mock_bravia_adapter):
         """Should return error status when communication fails."""
         mock_bravia_adapter.get_power_status.return_value = "error"
         
-        response = client.get(f"/api/v1/displays/{sample_display.id}/status")
+        response = await client.get(f"/api/v1/displays/{sample_display.id}/status")
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "error"
+        assert PowerStatusResponse.model_validate_json(response.content).status == "error"
     
-    def test_get_status_not_found(self, client, mock_bravia_adapter):
+    async def test_get_status_not_found(self, client, mock_bravia_adapter):
         """Should return 404 for non-existent display."""
-        response = client.get("/api/v1/displays/9999/status")
+        response = await client.get(MISSING_DISPLAY_STATUS_URL)
         assert response.status_code == 404
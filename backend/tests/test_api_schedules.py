@@ -2,40 +2,30 @@
 TDD: Schedule API endpoint tests
 """
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-from app.db.models import Schedule, Display, Group, Base
-from app.db.database import engine, SessionLocal, get_db
+from typing import List
+from app.db.models import Schedule, Display, Group
+from app.schemas.schedule import ScheduleResponse
+from pydantic import TypeAdapter
 
 
-@pytest.fixture
-def db():
-    Base.metadata.create_all(bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
-    Base.metadata.drop_all(bind=engine)
+ScheduleList = TypeAdapter(List[ScheduleResponse])
 
+# Request paths parsed once instead of on every call
+SCHEDULES_URL = httpx.URL("/api/v1/schedules")
 
-@pytest.fixture
-def client(db):
-    from app.main import verify_credentials
-    
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
-    
-    def override_verify_credentials():
-        return "test_user"
-    
-    app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[verify_credentials] = override_verify_credentials
-    with TestClient(app) as test_client:
-        yield test_client
-    app.dependency_overrides.clear()
+# Request bodies built once and shared by the tests below
+CREATE_PAYLOAD = {
+    "name": "New Schedule",
+    "action": "on",
+    "cron_expression": "0 8 * * *",
+    "enabled": True
+}
+UPDATE_DISABLE_PAYLOAD = {"enabled": False}
+
+# Every test gets its own rolled-back session and adapter mock (see conftest.client)
+pytestmark = pytest.mark.usefixtures("db", "mock_bravia_adapter")
 
 
 @pytest.fixture
@@ -43,7 +33,6 @@ def sample_display(db):
     display = Display(name="TV", ip_address="192.168.1.100", psk="psk", status="active")
     db.add(display)
     db.commit()
-    db.refresh(display)
     return display
 
 
@@ -58,45 +47,36 @@ def sample_schedule(db, sample_display):
     )
     db.add(schedule)
     db.commit()
-    db.refresh(schedule)
     return schedule
 
 
 class TestScheduleList:
-    def test_list_schedules_empty(self, client):
-        response = client.get("/api/v1/schedules")
+    async def test_list_schedules_empty(self, client):
+        response = await client.get(SCHEDULES_URL)
         assert response.status_code == 200
-        assert response.json() == []
+        assert ScheduleList.validate_json(response.content) == []
     
-    def test_list_schedules_single(self, client, sample_schedule):
-        response = client.get("/api/v1/schedules")
+    async def test_list_schedules_single(self, client, sample_schedule):
+        response = await client.get(SCHEDULES_URL)
         assert response.status_code == 200
-        assert len(response.json()) == 1
+        assert len(ScheduleList.validate_json(response.content)) == 1
 
 
 class TestScheduleCreate:
-    def test_create_schedule_success(self, client, sample_display):
-        payload = {
-            "name": "New Schedule",
-            "display_id": sample_display.id,
-            "action": "on",
-            "cron_expression": "0 8 * * *",
-            "enabled": True
-        }
-        response = client.post("/api/v1/schedules", json=payload)
+    async def test_create_schedule_success(self, client, sample_display):
+        response = await client.post(SCHEDULES_URL, json=CREATE_PAYLOAD | {"display_id": sample_display.id})
         assert response.status_code == 201
-        assert response.json()["name"] == "New Schedule"
+        assert ScheduleResponse.model_validate_json(response.content).name == "New Schedule"
 
 
 class TestScheduleUpdate:
-    def test_update_schedule_success(self, client, sample_schedule):
-        payload = {"enabled": False}
-        response = client.put(f"/api/v1/schedules/{sample_schedule.id}", json=payload)
+    async def test_update_schedule_success(self, client, sample_schedule):
+        response = await client.put(f"/api/v1/schedules/{sample_schedule.id}", json=UPDATE_DISABLE_PAYLOAD)
         assert response.status_code == 200
-        assert response.json()["enabled"] is False
+        assert ScheduleResponse.model_validate_json(response.content).enabled is False
 
 
 class TestScheduleDelete:
-    def test_delete_schedule_success(self, client, sample_schedule):
-        response = client.delete(f"/api/v1/schedules/{sample_schedule.id}")
+    async def test_delete_schedule_success(self, client, sample_schedule):
+        response = await client.delete(f"/api/v1/schedules/{sample_schedule.id}")
         assert response.status_code == 204
@@ -8,325 +8,400 @@ This module provides comprehensive tests for:
 """
 
 import asyncio
+import json
+import logging
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from app.adapters.bravia import BraviaAdapter, BraviaRestAdapter, BraviaSimpleIPAdapter
 
-class TestBraviaRestAdapter:
-    """Tests for BraviaRestAdapter (REST API control)."""
 
-    @pytest.mark.asyncio
-    async def test_rest_get_power_status_active(self):
-        """Test REST adapter returns 'active' status."""
-        from app.adapters.bravia import BraviaRestAdapter
+def _resp(payload: dict) -> SimpleNamespace:
+    """Minimal stand-in for a successful httpx.Response carrying ``payload``."""
+    return SimpleNamespace(json=lambda: payload, raise_for_status=lambda: None)
 
-        adapter = BraviaRestAdapter()
 
-        # Mock httpx.AsyncClient
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"result": [{"status": "active"}]}
-            mock_response.raise_for_status = MagicMock()
-            mock_client.post.return_value = mock_response
+def _sip_writer() -> MagicMock:
+    """StreamWriter stand-in: synchronous write/close, awaitable drain, open until closed."""
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    writer.is_closing.return_value = False
+    return writer
 
-            status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
-            assert status == "active"
-            mock_client.post.assert_called_once()
-            call_args = mock_client.post.call_args
-            assert call_args[0][0] == "http://192.168.1.100/sony/system"
-            assert call_args[1]["headers"]["X-Auth-PSK"] == "test_psk"
-            assert call_args[1]["json"]["method"] == "getPowerStatus"
+class TestBraviaRestAdapter:
+    """Tests for BraviaRestAdapter (REST API control)."""
 
     @pytest.mark.asyncio
-    async def test_rest_get_power_status_standby(self):
-        """Test REST adapter returns 'standby' status."""
-        from app.adapters.bravia import BraviaRestAdapter
+    @pytest.mark.parametrize("power_status", ["active", "standby"])
+    async def test_rest_get_power_status(self, rest_adapter, rest_transport, power_status):
+        """Test REST adapter returns the status the TV reports."""
+        rest_transport.power_status = power_status
 
-        adapter = BraviaRestAdapter()
+        status = await rest_adapter.get_power_status("192.168.1.100", "test_psk")
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"result": [{"status": "standby"}]}
-            mock_response.raise_for_status = MagicMock()
-            mock_client.post.return_value = mock_response
+        assert status == power_status
+        assert len(rest_transport.requests) == 1
+        request = rest_transport.requests[0]
+        assert str(request.url) == "http://192.168.1.100/sony/system"
+        assert request.headers["X-Auth-PSK"] == "test_psk"
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content)["method"] == "getPowerStatus"
 
-            status = await adapter.get_power_status("192.168.1.100", "test_psk")
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("on", [True, False])
+    async def test_rest_set_power(self, rest_adapter, rest_transport, on):
+        """Test REST adapter sends the power ON/OFF command."""
+        result = await rest_adapter.set_power("192.168.1.100", "test_psk", on)
 
-            assert status == "standby"
+        assert result is True
+        body = json.loads(rest_transport.requests[-1].content)
+        assert body["method"] == "setPowerStatus"
+        assert body["params"] == [{"status": on}]
 
     @pytest.mark.asyncio
-    async def test_rest_set_power_on(self):
-        """Test REST adapter sends power ON command."""
-        from app.adapters.bravia import BraviaRestAdapter
+    async def test_rest_retry_on_failure(self, rest_adapter, rest_transport, sleep_delays):
+        """Test REST adapter retries 3 times on failure."""
+        # Fail twice, succeed on third attempt
+        rest_transport.queued += [httpx.Response(503), httpx.Response(503)]
 
-        adapter = BraviaRestAdapter()
+        status = await rest_adapter.get_power_status("192.168.1.100", "test_psk")
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"result": [], "id": 1}
-            mock_response.raise_for_status = MagicMock()
-            mock_client.post.return_value = mock_response
+        assert status == "active"
+        assert len(rest_transport.requests) == 3
+        # Exponential backoff with up to 50% jitter: ~0.3s, then ~0.6s
+        assert len(sleep_delays) == 2
+        assert 0.3 <= sleep_delays[0] <= 0.45
+        assert 0.6 <= sleep_delays[1] <= 0.9
+
+    @pytest.mark.asyncio
+    async def test_rest_returns_error_after_max_retries(self, rest_adapter, rest_transport):
+        """Test REST adapter returns 'error' after 3 failed attempts."""
+        # Fail all attempts
+        rest_transport.queued += [httpx.Response(503)] * 3
 
-            result = await adapter.set_power("192.168.1.100", "test_psk", True)
+        status = await rest_adapter.get_power_status("192.168.1.100", "test_psk")
 
-            assert result is True
-            call_args = mock_client.post.call_args
-            assert call_args[1]["json"]["method"] == "setPowerStatus"
-            assert call_args[1]["json"]["params"] == [{"status": True}]
+        assert status == "error"
+        assert len(rest_transport.requests) == 3
 
     @pytest.mark.asyncio
-    async def test_rest_set_power_off(self):
-        """Test REST adapter sends power OFF command."""
-        from app.adapters.bravia import BraviaRestAdapter
+    async def test_rest_gives_up_when_retry_budget_is_spent(self, rest_transport, _shared_rest_client, sleep_delays):
+        """Test REST adapter stops retrying once backoff would exceed total_timeout."""
+        adapter = BraviaRestAdapter(max_retries=10, total_timeout=1.0, client=_shared_rest_client)
+        rest_transport.queued += [httpx.Response(503)] * 10
 
-        adapter = BraviaRestAdapter()
+        status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"result": [], "id": 1}
-            mock_response.raise_for_status = MagicMock()
-            mock_client.post.return_value = mock_response
+        assert status == "error"
+        # Third backoff (>= 1.2s) would overrun the 1s budget, so it is never slept
+        assert len(rest_transport.requests) == 3
+        assert len(sleep_delays) == 2
 
-            result = await adapter.set_power("192.168.1.100", "test_psk", False)
+    @pytest.mark.asyncio
+    async def test_rest_hanging_attempt_is_cut_off_at_budget(self):
+        """Test a TV that never answers cannot hold a call past total_timeout."""
+        async def hang(request: httpx.Request) -> httpx.Response:
+            await asyncio.Event().wait()
 
-            assert result is True
-            call_args = mock_client.post.call_args
-            assert call_args[1]["json"]["params"] == [{"status": False}]
+        async with httpx.AsyncClient(transport=httpx.MockTransport(hang)) as client:
+            adapter = BraviaRestAdapter(timeout=30.0, total_timeout=0.05, client=client)
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+
+            status = await adapter.get_power_status("192.168.1.100", "test_psk")
+
+            assert status == "error"
+            assert loop.time() - started < 1.0
 
     @pytest.mark.asyncio
-    async def test_rest_retry_on_failure(self):
-        """Test REST adapter retries 3 times on failure."""
-        from app.adapters.bravia import BraviaRestAdapter
+    async def test_rest_uses_short_connect_timeout(self, rest_adapter, rest_transport):
+        """Test REST requests fail fast on connect but allow the full timeout for the answer."""
+        await rest_adapter.get_power_status("192.168.1.100", "test_psk")
 
-        adapter = BraviaRestAdapter()
+        assert rest_transport.requests[0].extensions["timeout"] == {
+            "connect": 2.0,
+            "read": 5.0,
+            "write": 5.0,
+            "pool": 2.0,
+        }
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            # Fail twice, succeed on third attempt
-            mock_response_error = MagicMock()
-            mock_response_error.raise_for_status.side_effect = Exception("Connection error")
-            mock_response_success = MagicMock()
-            mock_response_success.json.return_value = {"result": [{"status": "active"}]}
-            mock_response_success.raise_for_status = MagicMock()
-            mock_client.post.side_effect = [
-                mock_response_error,
-                mock_response_error,
-                mock_response_success,
-            ]
+    @pytest.mark.asyncio
+    async def test_rest_does_not_retry_client_errors(self, rest_adapter, rest_transport):
+        """Test REST adapter fails immediately on 4xx (e.g. wrong PSK)."""
+        rest_transport.queued.append(httpx.Response(403))
 
-            with patch("asyncio.sleep", return_value=None):  # Speed up test
-                status = await adapter.get_power_status("192.168.1.100", "test_psk")
+        status = await rest_adapter.get_power_status("192.168.1.100", "wrong_psk")
 
-            assert status == "active"
-            assert mock_client.post.call_count == 3
+        assert status == "error"
+        assert len(rest_transport.requests) == 1
 
     @pytest.mark.asyncio
-    async def test_rest_returns_error_after_max_retries(self):
-        """Test REST adapter returns 'error' after 3 failed attempts."""
-        from app.adapters.bravia import BraviaRestAdapter
+    async def test_rest_timeout_handling(self, rest_adapter, rest_transport):
+        """Test REST adapter handles timeout errors."""
+        rest_transport.queued += [httpx.TimeoutException("Timeout")] * 3
 
-        adapter = BraviaRestAdapter()
+        status = await rest_adapter.get_power_status("192.168.1.100", "test_psk")
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            # Fail all attempts
-            mock_response_error = MagicMock()
-            mock_response_error.raise_for_status.side_effect = Exception("Connection error")
-            mock_client.post.return_value = mock_response_error
+        assert status == "error"
 
-            with patch("asyncio.sleep", return_value=None):  # Speed up test
-                status = await adapter.get_power_status("192.168.1.100", "test_psk")
+    @pytest.mark.asyncio
+    async def test_rest_invalid_response_format(self, rest_adapter, rest_transport):
+        """Test REST adapter handles invalid JSON response."""
+        rest_transport.queued += [httpx.Response(200, json={"invalid": "format"})] * 3
 
-            assert status == "error"
-            assert mock_client.post.call_count == 3
+        status = await rest_adapter.get_power_status("192.168.1.100", "test_psk")
 
-    @pytest.mark.asyncio
-    async def test_rest_timeout_handling(self):
-        """Test REST adapter handles timeout errors."""
-        from app.adapters.bravia import BraviaRestAdapter
+        assert status == "error"
 
+    @pytest.mark.asyncio
+    async def test_rest_reuses_pooled_client(self):
+        """Test REST adapter creates its HTTP client once and reuses it."""
         adapter = BraviaRestAdapter()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            import httpx
+            mock_client_class.return_value = mock_client
+            mock_client.post.return_value = _resp({"result": [{"status": "active"}]})
 
-            mock_client.post.side_effect = httpx.TimeoutException("Timeout")
+            await adapter.get_power_status("192.168.1.100", "test_psk")
+            await adapter.get_power_status("192.168.1.101", "test_psk")
 
-            with patch("asyncio.sleep", return_value=None):
-                status = await adapter.get_power_status("192.168.1.100", "test_psk")
+            mock_client_class.assert_called_once()
+            assert mock_client.post.call_count == 2
 
-            assert status == "error"
+            await adapter.aclose()
+            mock_client.aclose.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_rest_invalid_response_format(self):
-        """Test REST adapter handles invalid JSON response."""
-        from app.adapters.bravia import BraviaRestAdapter
+    async def test_rest_aclose_leaves_shared_client_open(self):
+        """Test REST adapter does not close a client it was given."""
+        client = AsyncMock()
+        adapter = BraviaRestAdapter(client=client)
 
-        adapter = BraviaRestAdapter()
+        await adapter.aclose()
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"invalid": "format"}
-            mock_response.raise_for_status = MagicMock()
-            mock_client.post.return_value = mock_response
+        client.aclose.assert_not_called()
 
-            with patch("asyncio.sleep", return_value=None):
+    @pytest.mark.asyncio
+    async def test_rest_uses_shared_client(self):
+        """Test REST adapter sends requests through a provided pooled client."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"result": [{"status": "active"}]})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = BraviaRestAdapter(client=client)
+
+            with patch("httpx.AsyncClient") as mock_client_class:
                 status = await adapter.get_power_status("192.168.1.100", "test_psk")
+                result = await adapter.set_power("192.168.1.100", "test_psk", True)
 
-            assert status == "error"
+            mock_client_class.assert_not_called()
+
+        assert status == "active"
+        assert result is True
+        assert [str(r.url) for r in requests] == ["http://192.168.1.100/sony/system"] * 2
+        assert requests[0].headers["X-Auth-PSK"] == "test_psk"
 
 
 class TestBraviaSimpleIPAdapter:
     """Tests for BraviaSimpleIPAdapter (Simple IP Control)."""
 
     @pytest.mark.asyncio
-    async def test_simple_ip_get_power_status_on(self):
-        """Test Simple IP adapter returns 'active' for power ON."""
-        from app.adapters.bravia import BraviaSimpleIPAdapter
-
+    @pytest.mark.parametrize("answer, expected", [
+        (b"*SAPOWR0000000000000001\n", "active"),
+        (b"*SAPOWR0000000000000000\n", "standby"),
+    ])
+    async def test_simple_ip_get_power_status(self, answer, expected):
+        """Test Simple IP adapter maps the power answer to 'active'/'standby'."""
         adapter = BraviaSimpleIPAdapter()
 
         with patch("asyncio.open_connection") as mock_open:
             mock_reader = AsyncMock()
-            mock_writer = AsyncMock()
+            mock_writer = _sip_writer()
             mock_open.return_value = (mock_reader, mock_writer)
-            # Response: *SAPOWR0000000000000001\n (power ON)
-            mock_reader.read.return_value = b"*SAPOWR0000000000000001\n"
+            mock_reader.readexactly.return_value = answer
 
             status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
-            assert status == "active"
+            assert status == expected
             mock_writer.write.assert_called_once()
             sent_data = mock_writer.write.call_args[0][0]
             assert b"*SEPOWR" in sent_data
             assert len(sent_data) == 24
 
     @pytest.mark.asyncio
-    async def test_simple_ip_get_power_status_off(self):
-        """Test Simple IP adapter returns 'standby' for power OFF."""
-        from app.adapters.bravia import BraviaSimpleIPAdapter
-
+    @pytest.mark.parametrize("on, packet", [
+        (True, b"*SCPOWR0000000000000001\n"),
+        (False, b"*SCPOWR0000000000000000\n"),
+    ])
+    async def test_simple_ip_set_power(self, on, packet):
+        """Test Simple IP adapter sends the correct packet for power ON/OFF."""
         adapter = BraviaSimpleIPAdapter()
 
         with patch("asyncio.open_connection") as mock_open:
             mock_reader = AsyncMock()
-            mock_writer = AsyncMock()
+            mock_writer = _sip_writer()
             mock_open.return_value = (mock_reader, mock_writer)
-            # Response: *SAPOWR0000000000000000\n (power OFF)
-            mock_reader.read.return_value = b"*SAPOWR0000000000000000\n"
+            mock_reader.readexactly.return_value = b"*SAPOWR0000000000000000\n"
 
-            status = await adapter.get_power_status("192.168.1.100", "test_psk")
+            result = await adapter.set_power("192.168.1.100", "test_psk", on)
 
-            assert status == "standby"
+            assert result is True
+            sent_data = mock_writer.write.call_args[0][0]
+            assert sent_data == packet
+            assert len(sent_data) == 24
 
     @pytest.mark.asyncio
-    async def test_simple_ip_set_power_on(self):
-        """Test Simple IP adapter sends correct packet for power ON."""
-        from app.adapters.bravia import BraviaSimpleIPAdapter
+    async def test_simple_ip_connection_error(self):
+        """Test Simple IP adapter handles connection errors."""
+        adapter = BraviaSimpleIPAdapter()
+
+        with patch("asyncio.open_connection") as mock_open:
+            mock_open.side_effect = ConnectionRefusedError("Connection refused")
+
+            status = await adapter.get_power_status("192.168.1.100", "test_psk")
+
+            assert status == "error"
 
+    @pytest.mark.asyncio
+    async def test_simple_ip_invalid_response(self):
+        """Test Simple IP adapter handles invalid responses."""
         adapter = BraviaSimpleIPAdapter()
 
         with patch("asyncio.open_connection") as mock_open:
             mock_reader = AsyncMock()
-            mock_writer = AsyncMock()
+            mock_writer = _sip_writer()
             mock_open.return_value = (mock_reader, mock_writer)
-            mock_reader.read.return_value = b"*SAPOWR0000000000000001\n"
+            # Connection closed after a short, garbled answer
+            mock_reader.readexactly.side_effect = asyncio.IncompleteReadError(b"INVALID_RESPONSE", 24)
 
-            result = await adapter.set_power("192.168.1.100", "test_psk", True)
+            status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
-            assert result is True
-            sent_data = mock_writer.write.call_args[0][0]
-            assert sent_data == b"*SCPOWR0000000000000001\n"
-            assert len(sent_data) == 24
+            assert status == "error"
+            mock_reader.readexactly.assert_called_with(24)
+            assert mock_writer.close.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_simple_ip_set_power_off(self):
-        """Test Simple IP adapter sends correct packet for power OFF."""
-        from app.adapters.bravia import BraviaSimpleIPAdapter
+    async def test_simple_ip_silent_tv_times_out(self):
+        """Test Simple IP adapter gives up on a TV that accepts the connection but never answers."""
+        adapter = BraviaSimpleIPAdapter(timeout=0.01)
 
-        adapter = BraviaSimpleIPAdapter()
+        async def never_answers(n):
+            await asyncio.Event().wait()
 
         with patch("asyncio.open_connection") as mock_open:
             mock_reader = AsyncMock()
-            mock_writer = AsyncMock()
+            mock_writer = _sip_writer()
             mock_open.return_value = (mock_reader, mock_writer)
-            mock_reader.read.return_value = b"*SAPOWR0000000000000000\n"
+            mock_reader.readexactly.side_effect = never_answers
 
-            result = await adapter.set_power("192.168.1.100", "test_psk", False)
+            status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
-            assert result is True
-            sent_data = mock_writer.write.call_args[0][0]
-            assert sent_data == b"*SCPOWR0000000000000000\n"
+            assert status == "error"
+            assert mock_open.call_count == 3
+            assert mock_writer.close.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_simple_ip_connection_error(self):
-        """Test Simple IP adapter handles connection errors."""
-        from app.adapters.bravia import BraviaSimpleIPAdapter
-
+    async def test_simple_ip_rejects_unknown_power_value(self):
+        """Test a well-formed power answer with an unknown state byte is an error."""
         adapter = BraviaSimpleIPAdapter()
 
         with patch("asyncio.open_connection") as mock_open:
-            mock_open.side_effect = ConnectionRefusedError("Connection refused")
+            mock_reader = AsyncMock()
+            mock_writer = _sip_writer()
+            mock_open.return_value = (mock_reader, mock_writer)
+            mock_reader.readexactly.return_value = b"*SAPOWRFFFFFFFFFFFFFFFF\n"
 
-            with patch("asyncio.sleep", return_value=None):
-                status = await adapter.get_power_status("192.168.1.100", "test_psk")
+            status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
             assert status == "error"
 
     @pytest.mark.asyncio
-    async def test_simple_ip_invalid_response(self):
-        """Test Simple IP adapter handles invalid responses."""
-        from app.adapters.bravia import BraviaSimpleIPAdapter
+    async def test_simple_ip_reuses_connection(self):
+        """Test Simple IP adapter keeps one connection per TV open across commands."""
+        adapter = BraviaSimpleIPAdapter()
 
+        with patch("asyncio.open_connection") as mock_open:
+            mock_reader = AsyncMock()
+            mock_writer = _sip_writer()
+            mock_open.return_value = (mock_reader, mock_writer)
+            mock_reader.readexactly.return_value = b"*SAPOWR0000000000000001\n"
+
+            assert await adapter.get_power_status("192.168.1.100", "test_psk") == "active"
+            assert await adapter.set_power("192.168.1.100", "test_psk", True) is True
+            assert await adapter.get_power_status("192.168.1.100", "test_psk") == "active"
+
+            assert mock_open.call_count == 1
+            assert mock_writer.write.call_count == 3
+            mock_writer.close.assert_not_called()
+
+            await adapter.aclose()
+            mock_writer.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_simple_ip_reconnects_stale_connection_without_retry(self, sleep_delays):
+        """Test a pooled connection the TV closed while idle is reopened at once, not retried with backoff."""
+        adapter = BraviaSimpleIPAdapter()
+
+        with patch("asyncio.open_connection") as mock_open:
+            stale_reader, fresh_reader = AsyncMock(), AsyncMock()
+            stale_writer, fresh_writer = _sip_writer(), _sip_writer()
+            mock_open.side_effect = [(stale_reader, stale_writer), (fresh_reader, fresh_writer)]
+            stale_reader.readexactly.side_effect = [
+                b"*SAPOWR0000000000000001\n",
+                asyncio.IncompleteReadError(b"", 24),
+            ]
+            fresh_reader.readexactly.return_value = b"*SAPOWR0000000000000000\n"
+
+            assert await adapter.get_power_status("192.168.1.100", "test_psk") == "active"
+            assert await adapter.get_power_status("192.168.1.100", "test_psk") == "standby"
+
+            assert mock_open.call_count == 2
+            stale_writer.close.assert_called_once()
+            assert sleep_delays == []
+
+    @pytest.mark.asyncio
+    async def test_simple_ip_skips_notifications(self):
+        """Test unsolicited *SN notifications on the open connection are not taken as the answer."""
         adapter = BraviaSimpleIPAdapter()
 
         with patch("asyncio.open_connection") as mock_open:
             mock_reader = AsyncMock()
-            mock_writer = AsyncMock()
+            mock_writer = _sip_writer()
             mock_open.return_value = (mock_reader, mock_writer)
-            mock_reader.read.return_value = b"INVALID_RESPONSE"
+            mock_reader.readexactly.side_effect = [
+                b"*SNPOWR0000000000000001\n",
+                b"*SAPOWR0000000000000000\n",
+            ]
 
-            with patch("asyncio.sleep", return_value=None):
-                status = await adapter.get_power_status("192.168.1.100", "test_psk")
+            status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
-            assert status == "error"
+            assert status == "standby"
 
     @pytest.mark.asyncio
     async def test_simple_ip_retry_logic(self):
         """Test Simple IP adapter retries on failure."""
-        from app.adapters.bravia import BraviaSimpleIPAdapter
-
         adapter = BraviaSimpleIPAdapter()
 
         with patch("asyncio.open_connection") as mock_open:
             mock_reader = AsyncMock()
-            mock_writer = AsyncMock()
+            mock_writer = _sip_writer()
             # Fail twice, succeed on third
             mock_open.side_effect = [
                 ConnectionRefusedError("Connection refused"),
                 ConnectionRefusedError("Connection refused"),
                 (mock_reader, mock_writer),
             ]
-            mock_reader.read.return_value = b"*SAPOWR0000000000000001\n"
+            mock_reader.readexactly.return_value = b"*SAPOWR0000000000000001\n"
 
-            with patch("asyncio.sleep", return_value=None):
-                status = await adapter.get_power_status("192.168.1.100", "test_psk")
+            status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
             assert status == "active"
             assert mock_open.call_count == 3
@@ -335,20 +410,22 @@ class TestBraviaSimpleIPAdapter:
 class TestBraviaAdapter:
     """Tests for BraviaAdapter (facade with fallback logic)."""
 
+    @pytest.fixture(autouse=True)
+    def _simple_ip_never_answers(self):
+        """Simple IP starts when REST has not answered within the hedge delay; keep it off the network unless a test patches it."""
+        async def hang(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        with patch("asyncio.open_connection", side_effect=hang):
+            yield
+
     @pytest.mark.asyncio
     async def test_facade_uses_rest_when_available(self):
         """Test facade uses REST API when it succeeds."""
-        from app.adapters.bravia import BraviaAdapter
-
         adapter = BraviaAdapter()
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"result": [{"status": "active"}]}
-            mock_response.raise_for_status = MagicMock()
-            mock_client.post.return_value = mock_response
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
+            mock_client.post.return_value = _resp({"result": [{"status": "active"}]})
 
             status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
@@ -359,77 +436,98 @@ class TestBraviaAdapter:
     @pytest.mark.asyncio
     async def test_facade_fallback_to_simple_ip(self):
         """Test facade falls back to Simple IP when REST fails."""
-        from app.adapters.bravia import BraviaAdapter
-
         adapter = BraviaAdapter()
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
             # REST fails
-            import httpx
-
             mock_client.post.side_effect = httpx.TimeoutException("Timeout")
 
             with patch("asyncio.open_connection") as mock_open:
                 mock_reader = AsyncMock()
-                mock_writer = AsyncMock()
+                mock_writer = _sip_writer()
                 mock_open.return_value = (mock_reader, mock_writer)
                 # Simple IP succeeds
-                mock_reader.read.return_value = b"*SAPOWR0000000000000001\n"
+                mock_reader.readexactly.return_value = b"*SAPOWR0000000000000001\n"
 
-                with patch("asyncio.sleep", return_value=None):
-                    status = await adapter.get_power_status("192.168.1.100", "test_psk")
+                status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
                 assert status == "active"
-                # Should have tried REST (3 times) then Simple IP
-                assert mock_client.post.call_count == 3
                 mock_open.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_facade_does_not_wait_for_hanging_rest(self):
+        """Test Simple IP answers once REST outlasts the hedge delay, and REST is cancelled."""
+        adapter = BraviaAdapter(hedge_delay=0.01)
+        rest_cancelled = asyncio.Event()
+
+        async def hanging_post(*args, **kwargs):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                rest_cancelled.set()
+                raise
+
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
+            mock_client.post.side_effect = hanging_post
+
+            with patch("asyncio.open_connection") as mock_open:
+                mock_reader = AsyncMock()
+                mock_writer = _sip_writer()
+                mock_open.return_value = (mock_reader, mock_writer)
+                mock_reader.readexactly.return_value = b"*SAPOWR0000000000000000\n"
+
+                status = await asyncio.wait_for(
+                    adapter.get_power_status("192.168.1.100", "test_psk"), timeout=1.0
+                )
+                await asyncio.wait_for(rest_cancelled.wait(), timeout=1.0)
+
+        assert status == "standby"
+        mock_client.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_facade_status_leaves_simple_ip_alone_when_rest_answers(self):
+        """Test a prompt REST answer never opens (or tears down) a Simple IP connection."""
+        adapter = BraviaAdapter(status_ttl=0)
+
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
+            mock_client.post.return_value = _resp({"result": [{"status": "active"}]})
+
+            with patch("asyncio.open_connection") as mock_open:
+                for _ in range(5):
+                    assert await adapter.get_power_status("192.168.1.100", "test_psk") == "active"
+
+                mock_open.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_facade_returns_error_when_both_fail(self):
         """Test facade returns 'error' when both protocols fail."""
-        from app.adapters.bravia import BraviaAdapter
-
         adapter = BraviaAdapter()
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            import httpx
-
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
             mock_client.post.side_effect = httpx.TimeoutException("Timeout")
 
             with patch("asyncio.open_connection") as mock_open:
                 mock_open.side_effect = ConnectionRefusedError("Connection refused")
 
-                with patch("asyncio.sleep", return_value=None):
-                    status = await adapter.get_power_status("192.168.1.100", "test_psk")
+                status = await adapter.get_power_status("192.168.1.100", "test_psk")
 
                 assert status == "error"
 
     @pytest.mark.asyncio
     async def test_facade_set_power_with_fallback(self):
         """Test facade set_power falls back to Simple IP."""
-        from app.adapters.bravia import BraviaAdapter
-
         adapter = BraviaAdapter()
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            import httpx
-
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
             mock_client.post.side_effect = httpx.TimeoutException("Timeout")
 
             with patch("asyncio.open_connection") as mock_open:
                 mock_reader = AsyncMock()
-                mock_writer = AsyncMock()
+                mock_writer = _sip_writer()
                 mock_open.return_value = (mock_reader, mock_writer)
-                mock_reader.read.return_value = b"*SAPOWR0000000000000001\n"
+                mock_reader.readexactly.return_value = b"*SAPOWR0000000000000001\n"
 
-                with patch("asyncio.sleep", return_value=None):
-                    result = await adapter.set_power("192.168.1.100", "test_psk", True)
+                result = await adapter.set_power("192.168.1.100", "test_psk", True)
 
                 assert result is True
                 # Should have tried REST then Simple IP
@@ -439,23 +537,66 @@ class TestBraviaAdapter:
     @pytest.mark.asyncio
     async def test_facade_logs_protocol_used(self, caplog):
         """Test facade logs which protocol was used."""
-        import logging
-        from app.adapters.bravia import BraviaAdapter
-
         # Ensure logs are captured
         caplog.set_level(logging.INFO, logger="app.adapters.bravia")
 
         adapter = BraviaAdapter()
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"result": [{"status": "active"}]}
-            mock_response.raise_for_status = MagicMock()
-            mock_client.post.return_value = mock_response
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
+            mock_client.post.return_value = _resp({"result": [{"status": "active"}]})
 
             await adapter.get_power_status("192.168.1.100", "test_psk")
 
             # Should log that REST was used
             assert any("REST" in record.message for record in caplog.records)
+
+    @pytest.mark.asyncio
+    async def test_facade_caches_status(self):
+        """Test back-to-back status queries within the TTL hit the TV once."""
+        adapter = BraviaAdapter()
+
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
+            mock_client.post.return_value = _resp({"result": [{"status": "active"}]})
+
+            assert await adapter.get_power_status("192.168.1.100", "test_psk") == "active"
+            assert await adapter.get_power_status("192.168.1.100", "test_psk") == "active"
+
+            assert mock_client.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_facade_coalesces_concurrent_status_queries(self):
+        """Test concurrent status queries for one TV share a single REST call."""
+        # No cache, so only coalescing can collapse the calls
+        adapter = BraviaAdapter(status_ttl=0)
+
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
+            mock_client.post.return_value = _resp({"result": [{"status": "active"}]})
+
+            statuses = await asyncio.gather(
+                *(adapter.get_power_status("192.168.1.100", "test_psk") for _ in range(5))
+            )
+
+            assert statuses == ["active"] * 5
+            assert mock_client.post.call_count == 1
+            assert adapter._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_facade_set_power_updates_cached_status(self):
+        """Test a successful set_power writes the new state through to the cache."""
+        adapter = BraviaAdapter()
+
+        with patch.object(adapter.rest, "_client", AsyncMock()) as mock_client:
+            mock_client.post.return_value = _resp({"result": []})
+
+            assert await adapter.set_power("192.168.1.100", "test_psk", False) is True
+            status = await adapter.get_power_status("192.168.1.100", "test_psk")
+
+            assert status == "standby"
+            assert mock_client.post.call_count == 1
+
+    def test_facade_passes_shared_client_to_rest(self):
+        """Test BraviaAdapter hands its shared client to the REST adapter."""
+        client = MagicMock()
+        adapter = BraviaAdapter(client=client)
+
+        assert adapter.rest._client is client
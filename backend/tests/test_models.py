@@ -6,25 +6,57 @@ Run these FIRST (should FAIL - RED phase), then implement models to pass them (G
 
 import pytest
 from datetime import datetime
-from app.db.models import Display, Group, DisplayGroup, Schedule, ScheduleExecution
-from app.db.database import engine, SessionLocal
-from sqlalchemy import inspect, select
-from sqlalchemy.orm import Session
+from app.db.models import Display, Group, DisplayGroup, Schedule, ScheduleDisplay, ScheduleExecution, ScheduleGroup
+from sqlalchemy import insert, inspect, select, update
+from sqlalchemy.orm import Session, raiseload, selectinload
 
+_NOW = datetime.utcnow()
+_PSK = "psk"
+_IP = "192.168.1.1"
+
+# ``db`` (tests/conftest.py): schema created once per session, each test
+# isolated in a SAVEPOINT that is rolled back on teardown
+
+
+def make_display(db: Session, **overrides) -> Display:
+    """Add and flush a display with test defaults; keyword arguments override them."""
+    display = Display(**{"name": "Test", "ip_address": _IP, "psk": _PSK, **overrides})
+    db.add(display)
+    db.flush()
+    return display
+
+
+@pytest.fixture(scope="class")
+def _seed(db_connection):
+    """
+    SAVEPOINT holding rows shared by one test class.
+
+    Sits below each test's own SAVEPOINT, so tests may change the seed rows
+    and still hand them back untouched; rolled back after the class.
+    """
+    savepoint = db_connection.begin_nested()
+    yield db_connection
+    savepoint.rollback()
 
-@pytest.fixture
-def db():
-    """Create a fresh database session for each test."""
-    # Create all tables
-    from app.db.models import Base
-    Base.metadata.create_all(bind=engine)
-    
-    session = SessionLocal()
-    yield session
-    session.close()
-    
-    # Clean up after test
-    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture(scope="class")
+def seed_display(_seed) -> int:
+    """Id of a display inserted once per test class."""
+    return _seed.execute(
+        insert(Display).returning(Display.id),
+        {"name": "Seed TV", "ip_address": "10.0.0.1", "psk": _PSK},
+    ).scalar_one()
+
+
+@pytest.fixture(scope="class")
+def seed_schedule(_seed, seed_display) -> int:
+    """Id of an enabled 07:00 "on" schedule targeting ``seed_display``, inserted once per test class."""
+    schedule_id = _seed.execute(
+        insert(Schedule).returning(Schedule.id),
+        {"name": "Test Schedule", "action": "on", "cron_expression": "0 7 * * *", "enabled": True},
+    ).scalar_one()
+    _seed.execute(insert(ScheduleDisplay), {"schedule_id": schedule_id, "display_id": seed_display})
+    return schedule_id
 
 
 class TestDisplayModel:
@@ -42,7 +74,6 @@ class TestDisplayModel:
         )
         db.add(display)
         db.commit()
-        db.refresh(display)
         
         assert display.id is not None
         assert display.name == "Conference Room TV"
@@ -54,25 +85,13 @@ class TestDisplayModel:
         assert display.created_at is not None
         assert display.last_seen is not None
     
-    def test_display_status_options(self, db: Session):
+    @pytest.mark.parametrize("status", ["active", "standby", "offline", "unknown"])
+    def test_display_status_options(self, db: Session, status: str):
         """Should support different status values: active, standby, offline, unknown."""
-        statuses = ["active", "standby", "offline", "unknown"]
-        
-        for status in statuses:
-            display = Display(
-                name=f"TV-{status}",
-                ip_address=f"192.168.1.{statuses.index(status)}",
-                psk="test_psk",
-                status=status,
-            )
-            db.add(display)
+        display = make_display(db, name=f"TV-{status}", psk="test_psk", status=status)
         
-        db.commit()
-        
-        retrieved = db.query(Display).all()
-        assert len(retrieved) == 4
-        retrieved_statuses = [d.status for d in retrieved]
-        assert all(s in statuses for s in retrieved_statuses)
+        retrieved = db.scalars(select(Display).where(Display.id == display.id)).one()
+        assert retrieved.status == status
     
     def test_display_tags_json(self, db: Session):
         """Should store and retrieve tags as JSON."""
@@ -87,15 +106,14 @@ class TestDisplayModel:
         display = Display(
             name="JSON Tags Test",
             ip_address="192.168.1.200",
-            psk="psk",
+            psk=_PSK,
             tags=tags,
         )
         db.add(display)
         db.commit()
-        db.refresh(display)
         
         # Retrieve and verify
-        retrieved = db.query(Display).filter_by(name="JSON Tags Test").first()
+        retrieved = db.scalars(select(Display).where(Display.name == "JSON Tags Test")).first()
         assert retrieved.tags == tags
         assert retrieved.tags["building"] == "main"
         assert retrieved.tags["floor"] == 3
@@ -105,7 +123,7 @@ class TestDisplayModel:
         display = Display(
             name="Last Seen Test",
             ip_address="192.168.1.50",
-            psk="psk",
+            psk=_PSK,
         )
         db.add(display)
         db.commit()
@@ -113,11 +131,13 @@ class TestDisplayModel:
         original_last_seen = display.last_seen
         
         # Update last_seen
-        display.last_seen = datetime.utcnow()
+        new_last_seen = datetime.utcnow()
+        display.last_seen = new_last_seen
         db.commit()
-        db.refresh(display)
         
         assert display.last_seen >= original_last_seen
+        # The stored value, not just the attribute set above
+        assert db.scalar(select(Display.last_seen).where(Display.id == display.id)) == new_last_seen
     
     def test_display_read_update_delete(self, db: Session):
         """Should support CRUD operations."""
@@ -134,7 +154,7 @@ class TestDisplayModel:
         display_id = display.id
         
         # Read
-        retrieved = db.query(Display).filter_by(id=display_id).first()
+        retrieved = db.get(Display, display_id)
         assert retrieved is not None
         assert retrieved.name == "CRUD Test Display"
         
@@ -143,7 +163,7 @@ class TestDisplayModel:
         retrieved.status = "standby"
         db.commit()
         
-        updated = db.query(Display).filter_by(id=display_id).first()
+        updated = db.get(Display, display_id)
         assert updated.name == "Updated Display Name"
         assert updated.status == "standby"
         
@@ -151,7 +171,7 @@ class TestDisplayModel:
         db.delete(updated)
         db.commit()
         
-        deleted = db.query(Display).filter_by(id=display_id).first()
+        deleted = db.get(Display, display_id)
         assert deleted is None
 
 
@@ -166,7 +186,6 @@ class TestGroupModel:
         )
         db.add(group)
         db.commit()
-        db.refresh(group)
         
         assert group.id is not None
         assert group.name == "Conference Rooms"
@@ -185,21 +204,21 @@ class TestGroupModel:
         group_id = group.id
         
         # Read
-        retrieved = db.query(Group).filter_by(id=group_id).first()
+        retrieved = db.get(Group, group_id)
         assert retrieved.name == "Test Group"
         
         # Update
         retrieved.description = "Updated description"
         db.commit()
         
-        updated = db.query(Group).filter_by(id=group_id).first()
+        updated = db.get(Group, group_id)
         assert updated.description == "Updated description"
         
         # Delete
         db.delete(updated)
         db.commit()
         
-        deleted = db.query(Group).filter_by(id=group_id).first()
+        deleted = db.get(Group, group_id)
         assert deleted is None
 
 
@@ -212,15 +231,14 @@ class TestDisplayGroupModel:
         display = Display(
             name="Office TV",
             ip_address="192.168.1.100",
-            psk="psk",
+            psk=_PSK,
         )
         group = Group(
             name="Office Displays",
             description="Displays in office area",
         )
-        db.add(display)
-        db.add(group)
-        db.commit()
+        db.add_all([display, group])
+        db.flush()
         
         # Add display to group
         display_group = DisplayGroup(
@@ -231,56 +249,68 @@ class TestDisplayGroupModel:
         db.commit()
         
         # Verify relationship
-        retrieved_dg = db.query(DisplayGroup).filter_by(
-            display_id=display.id,
-            group_id=group.id,
+        retrieved_dg = db.scalars(
+            select(DisplayGroup).where(
+                DisplayGroup.display_id == display.id,
+                DisplayGroup.group_id == group.id,
+            )
         ).first()
         assert retrieved_dg is not None
     
-    def test_group_with_multiple_displays(self, db: Session):
+    def test_group_with_multiple_displays(self, db: Session, query_counter):
         """Should support multiple displays in one group."""
         group = Group(name="Multi Display Group")
         db.add(group)
-        db.commit()
+        db.flush()
         
         # Create multiple displays
-        displays = [
-            Display(name=f"TV-{i}", ip_address=f"192.168.1.{i}", psk="psk")
+        display_ids = db.scalars(insert(Display).returning(Display.id), [
+            {"name": f"TV-{i}", "ip_address": f"192.168.1.{i}", "psk": _PSK}
             for i in range(1, 4)
-        ]
-        db.add_all(displays)
-        db.commit()
+        ]).all()
         
         # Add all to group
-        for display in displays:
-            dg = DisplayGroup(display_id=display.id, group_id=group.id)
-            db.add(dg)
-        db.commit()
-        
-        # Verify
-        group_displays = db.query(DisplayGroup).filter_by(group_id=group.id).all()
-        assert len(group_displays) == 3
+        db.execute(insert(DisplayGroup), [
+            {"display_id": display_id, "group_id": group.id} for display_id in display_ids
+        ])
+        db.commit()
+        
+        # Verify; displays are loaded up front and any other lazy load raises
+        with query_counter.assert_queries(2):
+            group_displays = db.scalars(
+                select(DisplayGroup)
+                .where(DisplayGroup.group_id == group.id)
+                .options(selectinload(DisplayGroup.display), raiseload("*"))
+            ).all()
+            assert len(group_displays) == 3
+            assert sorted(dg.display.name for dg in group_displays) == ["TV-1", "TV-2", "TV-3"]
     
-    def test_display_in_multiple_groups(self, db: Session):
+    def test_display_in_multiple_groups(self, db: Session, query_counter):
         """Should support one display in multiple groups."""
-        display = Display(name="Shared TV", ip_address="192.168.1.50", psk="psk")
+        display = Display(name="Shared TV", ip_address="192.168.1.50", psk=_PSK)
         db.add(display)
-        db.commit()
+        db.flush()
         
         # Create multiple groups
-        groups = [Group(name=f"Group-{i}") for i in range(1, 4)]
-        db.add_all(groups)
-        db.commit()
+        group_ids = db.scalars(
+            insert(Group).returning(Group.id), [{"name": f"Group-{i}"} for i in range(1, 4)]
+        ).all()
         
         # Add display to all groups
-        for group in groups:
-            dg = DisplayGroup(display_id=display.id, group_id=group.id)
-            db.add(dg)
-        db.commit()
-        
-        # Verify
-        display_groups = db.query(DisplayGroup).filter_by(display_id=display.id).all()
-        assert len(display_groups) == 3
+        db.execute(insert(DisplayGroup), [
+            {"display_id": display.id, "group_id": group_id} for group_id in group_ids
+        ])
+        db.commit()
+        
+        # Verify; groups are loaded up front and any other lazy load raises
+        with query_counter.assert_queries(2):
+            display_groups = db.scalars(
+                select(DisplayGroup)
+                .where(DisplayGroup.display_id == display.id)
+                .options(selectinload(DisplayGroup.group), raiseload("*"))
+            ).all()
+            assert len(display_groups) == 3
+            assert sorted(dg.group.name for dg in display_groups) == ["Group-1", "Group-2", "Group-3"]
 
 
 class TestScheduleModel:
@@ -288,25 +318,22 @@ class TestScheduleModel:
     
     def test_create_schedule_for_display(self, db: Session):
         """Should create a schedule targeting a specific display."""
-        display = Display(name="Test Display", ip_address="192.168.1.1", psk="psk")
-        db.add(display)
-        db.commit()
+        display = make_display(db, name="Test Display")
         
         schedule = Schedule(
             name="Morning Power On",
-            display_id=display.id,
             action="on",
             cron_expression="0 7 * * MON-FRI",  # 7 AM on weekdays
             enabled=True,
+            schedule_displays=[ScheduleDisplay(display_id=display.id)],
         )
         db.add(schedule)
         db.commit()
-        db.refresh(schedule)
         
         assert schedule.id is not None
         assert schedule.name == "Morning Power On"
-        assert schedule.display_id == display.id
-        assert schedule.group_id is None  # Not a group schedule
+        assert [sd.display_id for sd in schedule.schedule_displays] == [display.id]
+        assert schedule.schedule_groups == []  # Not a group schedule
         assert schedule.action == "on"
         assert schedule.cron_expression == "0 7 * * MON-FRI"
         assert schedule.enabled is True
@@ -316,224 +343,208 @@ class TestScheduleModel:
         """Should create a schedule targeting a group."""
         group = Group(name="Test Group")
         db.add(group)
-        db.commit()
+        db.flush()
         
         schedule = Schedule(
             name="Afternoon Power Off",
-            group_id=group.id,
             action="off",
             cron_expression="0 18 * * *",  # 6 PM daily
             enabled=True,
+            schedule_groups=[ScheduleGroup(group_id=group.id)],
         )
         db.add(schedule)
         db.commit()
-        db.refresh(schedule)
         
-        assert schedule.group_id == group.id
-        assert schedule.display_id is None  # Not a display schedule
+        assert [sg.group_id for sg in schedule.schedule_groups] == [group.id]
+        assert schedule.schedule_displays == []  # Not a display schedule
         assert schedule.action == "off"
     
-    def test_schedule_action_options(self, db: Session):
+    @pytest.mark.parametrize("action", ["on", "off"])
+    def test_schedule_action_options(self, db: Session, action: str):
         """Should support action types: 'on' and 'off'."""
-        display = Display(name="Test", ip_address="192.168.1.1", psk="psk")
-        db.add(display)
-        db.commit()
-        
-        for action in ["on", "off"]:
-            schedule = Schedule(
-                name=f"Test {action}",
-                display_id=display.id,
-                action=action,
-                cron_expression="0 0 * * *",
-                enabled=True,
-            )
-            db.add(schedule)
-        
-        db.commit()
-        
-        schedules = db.query(Schedule).all()
-        actions = [s.action for s in schedules]
-        assert "on" in actions
-        assert "off" in actions
-    
-    def test_schedule_enable_disable(self, db: Session):
-        """Should support enabling/disabling schedules."""
-        display = Display(name="Test", ip_address="192.168.1.1", psk="psk")
-        db.add(display)
-        db.commit()
+        display = make_display(db)
         
         schedule = Schedule(
-            name="Test Schedule",
-            display_id=display.id,
-            action="on",
-            cron_expression="0 7 * * *",
+            name=f"Test {action}",
+            action=action,
+            cron_expression="0 0 * * *",
             enabled=True,
+            schedule_displays=[ScheduleDisplay(display_id=display.id)],
         )
         db.add(schedule)
         db.commit()
         
+        retrieved = db.scalars(select(Schedule).where(Schedule.id == schedule.id)).one()
+        assert retrieved.action == action
+    
+    def test_schedule_enable_disable(self, db: Session, seed_schedule: int):
+        """Should support enabling/disabling schedules."""
+        schedule = db.get(Schedule, seed_schedule)
+        assert schedule.enabled is True
+        
         # Disable
         schedule.enabled = False
         db.commit()
-        db.refresh(schedule)
         
         assert schedule.enabled is False
     
     def test_schedule_crud(self, db: Session):
         """Should support CRUD operations."""
-        display = Display(name="Test", ip_address="192.168.1.1", psk="psk")
-        db.add(display)
-        db.commit()
+        display = make_display(db)
         
         # Create
         schedule = Schedule(
             name="CRUD Schedule",
-            display_id=display.id,
             action="on",
             cron_expression="0 7 * * *",
             enabled=True,
+            schedule_displays=[ScheduleDisplay(display_id=display.id)],
         )
         db.add(schedule)
         db.commit()
         schedule_id = schedule.id
         
         # Read
-        retrieved = db.query(Schedule).filter_by(id=schedule_id).first()
+        retrieved = db.get(Schedule, schedule_id)
         assert retrieved.name == "CRUD Schedule"
         
         # Update
         retrieved.cron_expression = "0 8 * * *"
         db.commit()
         
-        updated = db.query(Schedule).filter_by(id=schedule_id).first()
+        updated = db.get(Schedule, schedule_id)
         assert updated.cron_expression == "0 8 * * *"
         
         # Delete
         db.delete(updated)
         db.commit()
         
-        deleted = db.query(Schedule).filter_by(id=schedule_id).first()
+        deleted = db.get(Schedule, schedule_id)
         assert deleted is None
 
 
-class TestScheduleExecutionModel:
-    """Tests for ScheduleExecution model - execution logs."""
+class TestScheduleTrigger:
+    """Tests for Schedule.trigger - cached CronTrigger for cron_expression."""
     
-    def test_log_schedule_execution_success(self, db: Session):
-        """Should log successful schedule execution."""
-        display = Display(name="Test", ip_address="192.168.1.1", psk="psk")
-        db.add(display)
+    def test_trigger_is_parsed_once(self, db: Session):
+        """Should reuse the same CronTrigger on repeated access."""
+        schedule = Schedule(name="Cached", action="on", cron_expression="0 7 * * MON-FRI")
+        db.add(schedule)
         db.commit()
         
-        schedule = Schedule(
-            name="Test Schedule",
-            display_id=display.id,
-            action="on",
-            cron_expression="0 7 * * *",
-            enabled=True,
-        )
+        trigger = schedule.trigger
+        assert "hour='7'" in str(trigger)
+        assert schedule.trigger is trigger
+    
+    def test_trigger_reset_on_cron_change(self, db: Session):
+        """Should rebuild the trigger after cron_expression is modified."""
+        schedule = Schedule(name="Changing", action="on", cron_expression="0 7 * * *")
+        db.add(schedule)
+        db.commit()
+        
+        original = schedule.trigger
+        schedule.cron_expression = "0 8 * * *"
+        
+        assert schedule.trigger is not original
+        assert "hour='8'" in str(schedule.trigger)
+    
+    def test_trigger_reset_on_expire(self, db: Session):
+        """Should rebuild the trigger when the row is reloaded from the database."""
+        schedule = Schedule(name="Reloaded", action="on", cron_expression="0 7 * * *")
         db.add(schedule)
         db.commit()
         
+        original = schedule.trigger
+        # Change the row behind the instance's back, then reload it
+        db.execute(
+            update(Schedule).where(Schedule.id == schedule.id).values(cron_expression="0 9 * * *"),
+            execution_options={"synchronize_session": False},
+        )
+        db.expire(schedule)
+        
+        assert schedule.trigger is not original
+        assert "hour='9'" in str(schedule.trigger)
+    
+    def test_trigger_invalid_cron_raises(self, db: Session):
+        """Should raise ValueError for an invalid cron expression."""
+        schedule = Schedule(name="Broken", action="on", cron_expression="invalid cron")
+        
+        with pytest.raises(ValueError, match="Invalid cron expression"):
+            schedule.trigger
+
+
+class TestScheduleExecutionModel:
+    """Tests for ScheduleExecution model - execution logs."""
+    
+    def test_log_schedule_execution_success(self, db: Session, seed_schedule: int):
+        """Should log successful schedule execution."""
         execution = ScheduleExecution(
-            schedule_id=schedule.id,
-            executed_at=datetime.utcnow(),
+            schedule_id=seed_schedule,
+            executed_at=_NOW,
             success=True,
             error_message=None,
         )
         db.add(execution)
         db.commit()
-        db.refresh(execution)
         
         assert execution.id is not None
-        assert execution.schedule_id == schedule.id
+        assert execution.schedule_id == seed_schedule
         assert execution.success is True
         assert execution.error_message is None
     
-    def test_log_schedule_execution_failure(self, db: Session):
+    def test_log_schedule_execution_failure(self, db: Session, seed_schedule: int):
         """Should log failed schedule execution with error message."""
-        display = Display(name="Test", ip_address="192.168.1.1", psk="psk")
-        db.add(display)
-        db.commit()
-        
-        schedule = Schedule(
-            name="Test Schedule",
-            display_id=display.id,
-            action="on",
-            cron_expression="0 7 * * *",
-            enabled=True,
-        )
-        db.add(schedule)
-        db.commit()
-        
         execution = ScheduleExecution(
-            schedule_id=schedule.id,
-            executed_at=datetime.utcnow(),
+            schedule_id=seed_schedule,
+            executed_at=_NOW,
             success=False,
             error_message="Connection timeout: 192.168.1.100:80",
         )
         db.add(execution)
         db.commit()
-        db.refresh(execution)
         
         assert execution.success is False
         assert execution.error_message == "Connection timeout: 192.168.1.100:80"
     
     def test_schedule_multiple_executions(self, db: Session):
         """Should support multiple execution logs per schedule."""
-        display = Display(name="Test", ip_address="192.168.1.1", psk="psk")
-        db.add(display)
-        db.commit()
+        display = make_display(db)
         
         schedule = Schedule(
             name="Recurring Schedule",
-            display_id=display.id,
             action="on",
             cron_expression="0 7 * * *",
             enabled=True,
+            schedule_displays=[ScheduleDisplay(display_id=display.id)],
         )
         db.add(schedule)
-        db.commit()
+        db.flush()
         
         # Log multiple executions
-        for i in range(5):
-            execution = ScheduleExecution(
-                schedule_id=schedule.id,
-                executed_at=datetime.utcnow(),
-                success=(i % 2 == 0),  # Alternate success/failure
-                error_message=None if (i % 2 == 0) else "Test error",
-            )
-            db.add(execution)
-        
-        db.commit()
-        
-        executions = db.query(ScheduleExecution).filter_by(schedule_id=schedule.id).all()
+        db.execute(insert(ScheduleExecution), [
+            {
+                "schedule_id": schedule.id,
+                "executed_at": _NOW,
+                "success": i % 2 == 0,  # Alternate success/failure
+                "error_message": None if i % 2 == 0 else "Test error",
+            }
+            for i in range(5)
+        ])
+        db.commit()
+        
+        executions = db.scalars(select(ScheduleExecution).where(ScheduleExecution.schedule_id == schedule.id)).all()
         assert len(executions) == 5
         successful = [e for e in executions if e.success]
         failed = [e for e in executions if not e.success]
         assert len(successful) == 3
         assert len(failed) == 2
     
-    def test_execution_crud(self, db: Session):
+    def test_execution_crud(self, db: Session, seed_schedule: int):
         """Should support CRUD operations on executions."""
-        display = Display(name="Test", ip_address="192.168.1.1", psk="psk")
-        db.add(display)
-        db.commit()
-        
-        schedule = Schedule(
-            name="Test Schedule",
-            display_id=display.id,
-            action="on",
-            cron_expression="0 7 * * *",
-            enabled=True,
-        )
-        db.add(schedule)
-        db.commit()
-        
         # Create
         execution = ScheduleExecution(
-            schedule_id=schedule.id,
-            executed_at=datetime.utcnow(),
+            schedule_id=seed_schedule,
+            executed_at=_NOW,
             success=True,
         )
         db.add(execution)
@@ -541,7 +552,7 @@ class TestScheduleExecutionModel:
         execution_id = execution.id
         
         # Read
-        retrieved = db.query(ScheduleExecution).filter_by(id=execution_id).first()
+        retrieved = db.get(ScheduleExecution, execution_id)
         assert retrieved.success is True
         
         # Update
@@ -549,7 +560,7 @@ class TestScheduleExecutionModel:
         retrieved.error_message = "Updated error"
         db.commit()
         
-        updated = db.query(ScheduleExecution).filter_by(id=execution_id).first()
+        updated = db.get(ScheduleExecution, execution_id)
         assert updated.success is False
         assert updated.error_message == "Updated error"
         
@@ -557,7 +568,7 @@ class TestScheduleExecutionModel:
         db.delete(updated)
         db.commit()
         
-        deleted = db.query(ScheduleExecution).filter_by(id=execution_id).first()
+        deleted = db.get(ScheduleExecution, execution_id)
         assert deleted is None
 
 
@@ -575,7 +586,7 @@ class TestModelIntegration:
             status="active",
         )
         db.add(display)
-        db.commit()
+        db.flush()
         
         # Create group
         group = Group(
@@ -583,46 +594,71 @@ class TestModelIntegration:
             description="For testing",
         )
         db.add(group)
-        db.commit()
+        db.flush()
         
         # Add display to group
         dg = DisplayGroup(display_id=display.id, group_id=group.id)
         db.add(dg)
-        db.commit()
+        db.flush()
         
         # Create schedule for group
         schedule = Schedule(
             name="Workflow Schedule",
-            group_id=group.id,
             action="on",
             cron_expression="0 7 * * *",
             enabled=True,
+            schedule_groups=[ScheduleGroup(group_id=group.id)],
         )
         db.add(schedule)
-        db.commit()
+        db.flush()
         
         # Log execution
         execution = ScheduleExecution(
             schedule_id=schedule.id,
-            executed_at=datetime.utcnow(),
+            executed_at=_NOW,
             success=True,
         )
         db.add(execution)
         db.commit()
         
         # Verify all relationships
-        retrieved_display = db.query(Display).filter_by(id=display.id).first()
+        retrieved_display = db.get(Display, display.id)
         assert retrieved_display is not None
         
-        retrieved_group = db.query(Group).filter_by(id=group.id).first()
+        retrieved_group = db.get(Group, group.id)
         assert retrieved_group is not None
         
-        group_members = db.query(DisplayGroup).filter_by(group_id=group.id).all()
+        group_members = db.scalars(select(DisplayGroup).where(DisplayGroup.group_id == group.id)).all()
         assert len(group_members) == 1
         
-        group_schedule = db.query(Schedule).filter_by(group_id=group.id).first()
+        group_schedule = db.scalars(
+            select(Schedule).join(ScheduleGroup).where(ScheduleGroup.group_id == group.id)
+        ).first()
         assert group_schedule is not None
         
-        executions = db.query(ScheduleExecution).filter_by(schedule_id=schedule.id).all()
+        executions = db.scalars(select(ScheduleExecution).where(ScheduleExecution.schedule_id == schedule.id)).all()
         assert len(executions) == 1
         assert executions[0].success is True
+
+
+class TestIndexes:
+    """Columns the app filters on must be indexed."""
+    
+    @pytest.mark.parametrize("table, column", [
+        ("display_groups", "display_id"),
+        ("display_groups", "group_id"),
+        ("schedule_executions", "schedule_id"),
+    ])
+    def test_indexes_present(self, db: Session, table: str, column: str):
+        """Column should lead an index (or the primary key) so lookups by it avoid a full scan."""
+        inspector = inspect(db.connection())
+        leading = {index["column_names"][0] for index in inspector.get_indexes(table)}
+        leading.update(inspector.get_pk_constraint(table)["constrained_columns"][:1])
+        assert column in leading
+    
+    def test_schedule_has_enabled_index(self):
+        """Enabled-schedule lookups should use a partial index covering only enabled rows."""
+        index = next(i for i in Schedule.__table__.indexes if i.name == "ix_schedule_enabled_true")
+        assert [column.name for column in index.columns] == ["enabled"]
+        assert str(index.dialect_options["postgresql"]["where"]) == "enabled = true"
+        assert str(index.dialect_options["sqlite"]["where"]) == "enabled IS 1"
@@ -9,57 +9,233 @@ Tests cover:
 - Scheduler lifecycle (start/stop)
 """
 
+import asyncio
+import logging
 import pytest
+from dataclasses import dataclass, field
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_PAUSED, STATE_RUNNING, STATE_STOPPED
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from app.services.scheduler import SchedulerService
-from app.db.models import Display, Group, Schedule, ScheduleExecution
+from app.adapters.bravia import BraviaAdapter
+from app.services import cron
+from app.services.scheduler import EXECUTION_LOG_BATCH_SIZE, SchedulerService
+from app.db.models import (
+    Display, Group, PowerLog, Schedule, ScheduleDisplay, ScheduleExecution, ScheduleGroup,
+)
 from app.db.database import get_db
 
+# Timestamp for test rows; nothing under test reads the current time from them
+_FROZEN_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+
+# Plain dataclass doubles for the ORM models: the scheduler only reads their
+# attributes, and these skip SQLAlchemy's instrumentation entirely
+
+@dataclass
+class FakeDisplay:
+    id: int
+    name: str
+    ip_address: str
+    psk: str
+    status: str = "active"
+    last_seen: datetime = _FROZEN_NOW
+    created_at: datetime = _FROZEN_NOW
+
+
+@dataclass
+class FakeDisplayGroup:
+    display: FakeDisplay
+
+
+@dataclass
+class FakeGroup:
+    id: int
+    name: str
+    description: Optional[str] = None
+    created_at: datetime = _FROZEN_NOW
+    display_groups: List[FakeDisplayGroup] = field(default_factory=list)
+
+
+@dataclass
+class FakeSchedule:
+    """Schedule targeting one display or one group, exposed through the same junction lists as the model."""
+    id: int
+    name: str
+    action: str
+    cron_expression: str
+    enabled: bool = True
+    created_at: datetime = _FROZEN_NOW
+    display: Optional[FakeDisplay] = None
+    group: Optional[FakeGroup] = None
+    
+    @property
+    def group_id(self):
+        return self.group.id if self.group else None
+    
+    @property
+    def schedule_displays(self):
+        return [SimpleNamespace(display=self.display)] if self.display else []
+    
+    @property
+    def schedule_groups(self):
+        return [SimpleNamespace(group=self.group)] if self.group else []
+    
+    @property
+    def trigger(self):
+        return cron.parse_cron(self.cron_expression)
+
+
+class FakeScheduler:
+    """
+    In-memory stand-in for AsyncIOScheduler: keeps jobs in a dict and never runs them.
+    
+    Starting and stopping take effect immediately, with no event loop involved.
+    Counts ``wakeups`` the way APScheduler would issue them.
+    """
+    
+    def __init__(self):
+        self._jobs = {}
+        self.state = STATE_STOPPED
+        self.wakeups = 0
+    
+    @property
+    def running(self):
+        return self.state != STATE_STOPPED
+    
+    def wakeup(self):
+        self.wakeups += 1
+    
+    def add_job(self, func, trigger=None, id=None, args=None, replace_existing=False):
+        if id in self._jobs and not replace_existing:
+            raise ValueError(f"Job {id} already exists")
+        self._jobs[id] = SimpleNamespace(id=id, func=func, trigger=trigger, args=args or [])
+        if self.state == STATE_RUNNING:
+            self.wakeup()
+        return self._jobs[id]
+    
+    def reschedule_job(self, job_id, trigger=None):
+        self._jobs[job_id].trigger = trigger
+        if self.state == STATE_RUNNING:
+            self.wakeup()
+        return self._jobs[job_id]
+    
+    def remove_job(self, job_id):
+        del self._jobs[job_id]
+    
+    def remove_all_jobs(self):
+        self._jobs.clear()
+    
+    def get_jobs(self):
+        return list(self._jobs.values())
+    
+    def start(self):
+        self.state = STATE_RUNNING
+    
+    def pause(self):
+        self.state = STATE_PAUSED
+    
+    def resume(self):
+        self.state = STATE_RUNNING
+        self.wakeup()
+    
+    def shutdown(self, wait=True):
+        self.state = STATE_STOPPED
+
+
+def make_query_router(first_results: Dict[type, Any]) -> Callable[[type], MagicMock]:
+    """
+    Side effect for ``mock_db.query``: ``query(Model).filter(...).first()`` returns ``first_results[Model]``.
+    
+    The query mocks are built once up front rather than on every ``query()`` call.
+    """
+    queries = {}
+    for model, result in first_results.items():
+        query = MagicMock()
+        query.filter.return_value.first.return_value = result
+        queries[model] = query
+    return queries.__getitem__
+
+
+def set_enabled_schedules(mock_db: MagicMock, schedules: List[Any]) -> None:
+    """Make ``mock_db`` serve ``schedules`` as the enabled schedules the scheduler loads."""
+    query = mock_db.query.return_value
+    # Existence probe: query(Schedule.id).filter(...).limit(1).scalar()
+    query.filter.return_value.limit.return_value.scalar.return_value = schedules[0].id if schedules else None
+    # Streamed load: query(Schedule).options(...).filter(...)[.options(...)].yield_per(...)
+    enabled = query.options.return_value.filter.return_value
+    enabled.yield_per.return_value = schedules
+    enabled.options.return_value.yield_per.return_value = schedules
+
 
 @pytest.fixture
 def mock_db():
     """Mock database session."""
-    db = MagicMock(spec=Session)
+    db = MagicMock(spec_set=Session)
     return db
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_bravia_adapter():
-    """Mock BraviaAdapter for testing."""
-    adapter = MagicMock()
-    adapter.set_power = AsyncMock(return_value=True)
-    adapter.get_power_status = AsyncMock(return_value="active")
+    """Mock BraviaAdapter for testing (shared by the module, reset after each test)."""
+    # Autospec: unknown attributes and wrong call signatures fail instead of passing silently
+    adapter = create_autospec(BraviaAdapter, spec_set=True, instance=True)
+    adapter.set_power.return_value = True
+    adapter.get_power_status.return_value = "active"
     return adapter
 
 
+@pytest.fixture(scope="module")
+def _shared_scheduler_service(mock_bravia_adapter):
+    """One SchedulerService for the module, built once."""
+    return SchedulerService(
+        db_session=MagicMock(spec_set=Session), scheduler_factory=FakeScheduler, adapter=mock_bravia_adapter
+    )
+
+
 @pytest.fixture
-def scheduler_service(mock_db, mock_bravia_adapter):
-    """Create scheduler service instance with mocked dependencies."""
-    with patch("app.services.scheduler.BraviaAdapter", return_value=mock_bravia_adapter):
-        service = SchedulerService(db_session=mock_db)
-        yield service
-        # Cleanup - only stop if running
-        if service.scheduler.running:
-            try:
-                service.stop()
-            except RuntimeError:
-                pass
+def scheduler_service(_shared_scheduler_service, mock_db, mock_bravia_adapter):
+    """Scheduler service with mocked dependencies and an empty FakeScheduler, wiped clean after each test."""
+    service = _shared_scheduler_service
+    service.db = mock_db
+    service.scheduler = FakeScheduler()
+    yield service
+    
+    service._stop_exec_log_writer()
+    service._job_crons.clear()
+    
+    for method, default in ((mock_bravia_adapter.set_power, True), (mock_bravia_adapter.get_power_status, "active")):
+        method.reset_mock(return_value=True, side_effect=True)
+        method.return_value = default
+
+
+@pytest.fixture
+def adapter_returns(mock_bravia_adapter):
+    """
+    Script the adapter's set_power outcomes for the running test, one per call.
+    
+    Exceptions in the list are raised instead of returned; the script is
+    cleared when ``scheduler_service`` tears down.
+    """
+    def _setup(*results):
+        mock_bravia_adapter.set_power.side_effect = list(results)
+        return mock_bravia_adapter
+    return _setup
 
 
 @pytest.fixture
 def sample_display(mock_db):
     """Create sample display for testing."""
-    display = Display(
+    display = FakeDisplay(
         id=1,
         name="Test Display",
         ip_address="192.168.1.100",
         psk="test_psk",
-        status="active",
-        last_seen=datetime.utcnow(),
-        created_at=datetime.utcnow()
     )
     mock_db.query.return_value.filter.return_value.first.return_value = display
     return display
@@ -67,15 +243,12 @@ def sample_display(mock_db):
 
 @pytest.fixture
 def sample_group(mock_db):
-    """Create sample group with displays for testing."""
-    group = Group(
+    """Create sample group (no displays yet) for testing."""
+    group = FakeGroup(
         id=1,
         name="Test Group",
         description="Test group description",
-        created_at=datetime.utcnow()
     )
-    # Mock the display_groups relationship
-    group.display_groups = []
     mock_db.query.return_value.filter.return_value.first.return_value = group
     return group
 
@@ -83,83 +256,65 @@ def sample_group(mock_db):
 @pytest.fixture
 def sample_schedule_display(sample_display):
     """Create sample schedule targeting a display."""
-    schedule = Schedule(
+    return FakeSchedule(
         id=1,
         name="Morning Power On",
-        display_id=sample_display.id,
-        group_id=None,
         action="on",
         cron_expression="0 7 * * MON-FRI",
-        enabled=True,
-        created_at=datetime.utcnow()
+        display=sample_display,
     )
-    schedule.display = sample_display
-    schedule.group = None
-    return schedule
 
 
 @pytest.fixture
 def sample_schedule_group(sample_group):
     """Create sample schedule targeting a group."""
-    schedule = Schedule(
+    return FakeSchedule(
         id=2,
         name="Evening Power Off",
-        display_id=None,
-        group_id=sample_group.id,
         action="off",
         cron_expression="0 18 * * *",
-        enabled=True,
-        created_at=datetime.utcnow()
+        group=sample_group,
     )
-    schedule.display = None
-    schedule.group = sample_group
-    return schedule
 
 
 class TestCronParsing:
     """Tests for cron expression parsing."""
     
-    def test_parse_simple_daily_cron(self, scheduler_service):
-        """Test parsing simple daily cron expression."""
-        # "0 7 * * *" = Every day at 7:00 AM
-        trigger = scheduler_service.parse_cron("0 7 * * *")
+    @pytest.mark.parametrize("expr, checks", [
+        # Every day at 7:00 AM
+        ("0 7 * * *", {"hour='7'", "minute='0'"}),
+        # Every weekday at 7:00 AM
+        ("0 7 * * MON-FRI", {"hour='7'", "minute='0'", "day_of_week='mon-fri'"}),
+        # Monday, Wednesday, Friday at 6:30 PM
+        ("30 18 * * MON,WED,FRI", {"hour='18'", "minute='30'"}),
+    ])
+    def test_parse_valid_cron(self, scheduler_service, expr, checks):
+        """Test parsing valid cron expressions."""
+        trigger = scheduler_service.parse_cron(expr)
         
         assert trigger is not None
         # CronTrigger stores fields in internal format, verify via string representation
         trigger_str = str(trigger)
-        assert "hour='7'" in trigger_str
-        assert "minute='0'" in trigger_str
+        for check in checks:
+            assert check in trigger_str
     
-    def test_parse_weekday_cron(self, scheduler_service):
-        """Test parsing weekday-specific cron expression."""
-        # "0 7 * * MON-FRI" = Every weekday at 7:00 AM
-        trigger = scheduler_service.parse_cron("0 7 * * MON-FRI")
-        
-        assert trigger is not None
-        trigger_str = str(trigger)
-        assert "hour='7'" in trigger_str
-        assert "minute='0'" in trigger_str
-        assert "day_of_week='mon-fri'" in trigger_str
+    @pytest.mark.parametrize("expr", ["invalid cron", ""])
+    def test_parse_invalid_cron(self, scheduler_service, expr):
+        """Test that invalid or empty cron expressions raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid cron expression"):
+            scheduler_service.parse_cron(expr)
     
-    def test_parse_specific_days_cron(self, scheduler_service):
-        """Test parsing cron with specific days."""
-        # "30 18 * * MON,WED,FRI" = Monday, Wednesday, Friday at 6:30 PM
-        trigger = scheduler_service.parse_cron("30 18 * * MON,WED,FRI")
+    def test_parse_cron_is_cached(self, scheduler_service):
+        """Test that repeated expressions reuse the already parsed trigger."""
+        trigger = scheduler_service.parse_cron("0 7 * * *")
         
-        assert trigger is not None
-        trigger_str = str(trigger)
-        assert "hour='18'" in trigger_str
-        assert "minute='30'" in trigger_str
+        assert scheduler_service.parse_cron("0 7 * * *") is trigger
     
-    def test_parse_invalid_cron_raises_error(self, scheduler_service):
-        """Test that invalid cron expression raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid cron expression"):
-            scheduler_service.parse_cron("invalid cron")
-    
-    def test_parse_empty_cron_raises_error(self, scheduler_service):
-        """Test that empty cron expression raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid cron expression"):
-            scheduler_service.parse_cron("")
+    def test_parse_apscheduler_only_syntax(self, scheduler_service):
+        """Test that APScheduler-specific syntax (e.g. "last" day of month) is accepted."""
+        trigger = scheduler_service.parse_cron("0 7 last * *")
+        
+        assert "day='last'" in str(trigger)
 
 
 class TestScheduleLoading:
@@ -168,19 +323,17 @@ class TestScheduleLoading:
     def test_load_enabled_schedules_only(self, scheduler_service, mock_db, sample_schedule_display):
         """Test that only enabled schedules are loaded."""
         enabled_schedule = sample_schedule_display
-        disabled_schedule = Schedule(
+        disabled_schedule = FakeSchedule(
             id=2,
             name="Disabled Schedule",
-            display_id=1,
             action="off",
             cron_expression="0 8 * * *",
             enabled=False,
-            created_at=datetime.utcnow()
+            display=sample_schedule_display.display,
         )
-        disabled_schedule.display = sample_schedule_display.display
         
         # Mock query to return both schedules
-        mock_db.query.return_value.filter.return_value.all.return_value = [enabled_schedule]
+        set_enabled_schedules(mock_db, [enabled_schedule])
         
         scheduler_service.load_schedules_from_db()
         
@@ -191,7 +344,7 @@ class TestScheduleLoading:
     
     def test_load_schedules_display_target(self, scheduler_service, mock_db, sample_schedule_display):
         """Test loading schedule targeting a display."""
-        mock_db.query.return_value.filter.return_value.all.return_value = [sample_schedule_display]
+        set_enabled_schedules(mock_db, [sample_schedule_display])
         
         scheduler_service.load_schedules_from_db()
         
@@ -201,7 +354,7 @@ class TestScheduleLoading:
     
     def test_load_schedules_group_target(self, scheduler_service, mock_db, sample_schedule_group):
         """Test loading schedule targeting a group."""
-        mock_db.query.return_value.filter.return_value.all.return_value = [sample_schedule_group]
+        set_enabled_schedules(mock_db, [sample_schedule_group])
         
         scheduler_service.load_schedules_from_db()
         
@@ -211,17 +364,19 @@ class TestScheduleLoading:
     
     def test_load_schedules_empty_database(self, scheduler_service, mock_db):
         """Test loading schedules when database is empty."""
-        mock_db.query.return_value.filter.return_value.all.return_value = []
+        mock_db.query.return_value.filter.return_value.limit.return_value.scalar.return_value = None
         
         scheduler_service.load_schedules_from_db()
         
         jobs = scheduler_service.scheduler.get_jobs()
         assert len(jobs) == 0
+        # Only the existence probe ran, not the full schedules query
+        assert mock_db.query.call_count == 1
     
     def test_load_schedules_with_invalid_cron_skips_schedule(self, scheduler_service, mock_db, sample_schedule_display):
         """Test that schedules with invalid cron are skipped with logging."""
         sample_schedule_display.cron_expression = "invalid cron"
-        mock_db.query.return_value.filter.return_value.all.return_value = [sample_schedule_display]
+        set_enabled_schedules(mock_db, [sample_schedule_display])
         
         with patch("app.services.scheduler.logger") as mock_logger:
             scheduler_service.load_schedules_from_db()
@@ -233,26 +388,70 @@ class TestScheduleLoading:
         # Verify no jobs were added
         jobs = scheduler_service.scheduler.get_jobs()
         assert len(jobs) == 0
+    
+    def test_load_schedules_eager_loads_targets(self, scheduler_service, db, query_counter, caplog):
+        """Test that logging each schedule's targets does not lazy-load them one schedule at a time."""
+        group = Group(name="Eager Group")
+        displays = [Display(name=f"Eager TV {i}", ip_address=f"10.1.0.{i}", psk="psk") for i in range(3)]
+        db.add_all([group, *displays])
+        db.flush()
+        db.add_all([
+            Schedule(
+                name=f"Eager Schedule {i}",
+                action="on",
+                cron_expression="0 7 * * *",
+                schedule_displays=[ScheduleDisplay(display_id=display.id)],
+                schedule_groups=[ScheduleGroup(group_id=group.id)],
+            )
+            for i, display in enumerate(displays)
+        ])
+        db.commit()
+        db.expunge_all()
+        scheduler_service.db = db
+        caplog.set_level(logging.INFO, logger="app.services.scheduler")
+        
+        # Existence probe, schedules, then their displays and groups: one SELECT each, not two per schedule
+        with query_counter.assert_queries(4):
+            scheduler_service.load_schedules_from_db()
+        
+        assert len(scheduler_service.scheduler.get_jobs()) == 3
+        assert "1 display(s) + 1 group(s)" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_load_schedules_bulk(self, scheduler_service, db):
+        """Test that loading schedules into a running scheduler wakes it up once, not once per job."""
+        db.add_all([
+            Schedule(name=f"Bulk Schedule {i}", action="on", cron_expression=f"0 {i} * * *")
+            for i in range(5)
+        ])
+        db.commit()
+        scheduler_service.db = db
+        scheduler_service.scheduler = AsyncIOScheduler()
+        scheduler_service.start()
+        
+        try:
+            with patch.object(scheduler_service.scheduler, "wakeup") as wakeup:
+                scheduler_service.load_schedules_from_db()
+            
+            assert len(scheduler_service.scheduler.get_jobs()) == 5
+            assert wakeup.call_count <= 1
+        finally:
+            scheduler_service.stop()
 
 
 class TestScheduleExecution:
     """Tests for schedule execution."""
     
     @pytest.mark.asyncio
-    async def test_execute_display_power_on(self, scheduler_service, mock_db, sample_schedule_display, mock_bravia_adapter):
+    async def test_execute_display_power_on(self, scheduler_service, mock_db, sample_schedule_display, adapter_returns):
         """Test executing power ON command for display."""
+        mock_bravia_adapter = adapter_returns(True)
+        
         # Mock both Schedule and Display queries
-        def mock_query_side_effect(model):
-            mock_query = MagicMock()
-            if model == Schedule:
-                mock_query.filter.return_value.first.return_value = sample_schedule_display
-            elif model == Display:
-                mock_query.filter.return_value.first.return_value = sample_schedule_display.display
-            return mock_query
-        
-        mock_db.query.side_effect = mock_query_side_effect
-        mock_db.add = MagicMock()
-        mock_db.commit = MagicMock()
+        mock_db.query.side_effect = make_query_router({
+            Schedule: sample_schedule_display,
+            Display: sample_schedule_display.display,
+        })
         
         await scheduler_service.execute_schedule(sample_schedule_display.id)
         
@@ -264,30 +463,24 @@ class TestScheduleExecution:
         )
         
         # Verify execution was logged
-        mock_db.add.assert_called_once()
-        execution = mock_db.add.call_args[0][0]
+        mock_db.add_all.assert_called_once()
+        execution = mock_db.add_all.call_args[0][0][-1]
         assert isinstance(execution, ScheduleExecution)
         assert execution.schedule_id == sample_schedule_display.id
         assert execution.success is True
         assert execution.error_message is None
     
     @pytest.mark.asyncio
-    async def test_execute_display_power_off(self, scheduler_service, mock_db, sample_schedule_display, mock_bravia_adapter):
+    async def test_execute_display_power_off(self, scheduler_service, mock_db, sample_schedule_display, adapter_returns):
         """Test executing power OFF command for display."""
+        mock_bravia_adapter = adapter_returns(True)
         sample_schedule_display.action = "off"
         
         # Mock both Schedule and Display queries
-        def mock_query_side_effect(model):
-            mock_query = MagicMock()
-            if model == Schedule:
-                mock_query.filter.return_value.first.return_value = sample_schedule_display
-            elif model == Display:
-                mock_query.filter.return_value.first.return_value = sample_schedule_display.display
-            return mock_query
-        
-        mock_db.query.side_effect = mock_query_side_effect
-        mock_db.add = MagicMock()
-        mock_db.commit = MagicMock()
+        mock_db.query.side_effect = make_query_router({
+            Schedule: sample_schedule_display,
+            Display: sample_schedule_display.display,
+        })
         
         await scheduler_service.execute_schedule(sample_schedule_display.id)
         
@@ -303,67 +496,84 @@ class TestScheduleExecution:
         """Test executing schedule for a group with multiple displays."""
         # Setup group with displays
         display1 = sample_display
-        display2 = Display(
+        display2 = FakeDisplay(
             id=2,
             name="Test Display 2",
             ip_address="192.168.1.101",
             psk="test_psk_2",
-            status="active",
-            last_seen=datetime.utcnow(),
-            created_at=datetime.utcnow()
         )
         
-        # Mock DisplayGroup relationships
-        from app.db.models import DisplayGroup
-        dg1 = DisplayGroup(display_id=display1.id, group_id=sample_schedule_group.group_id)
-        dg1.display = display1
-        dg2 = DisplayGroup(display_id=display2.id, group_id=sample_schedule_group.group_id)
-        dg2.display = display2
-        
-        sample_schedule_group.group.display_groups = [dg1, dg2]
+        # Group membership
+        sample_schedule_group.group.display_groups = [FakeDisplayGroup(display1), FakeDisplayGroup(display2)]
         
         mock_db.query.return_value.filter.return_value.first.return_value = sample_schedule_group
-        mock_db.add = MagicMock()
-        mock_db.commit = MagicMock()
+        
+        # Record how many commands were in flight when each one finished
+        started = []
+        in_flight_at_finish = []
+        
+        async def set_power(ip, psk, on):
+            started.append(ip)
+            await asyncio.sleep(0)
+            in_flight_at_finish.append(len(started))
+            return True
+        
+        mock_bravia_adapter.set_power.side_effect = set_power
         
         await scheduler_service.execute_schedule(sample_schedule_group.id)
         
-        # Verify set_power was called for both displays
+        # Verify set_power was called for both displays, concurrently
         assert mock_bravia_adapter.set_power.call_count == 2
+        assert in_flight_at_finish == [2, 2]
         calls = mock_bravia_adapter.set_power.call_args_list
         assert calls[0][0] == (display1.ip_address, display1.psk, False)  # action="off"
         assert calls[1][0] == (display2.ip_address, display2.psk, False)
+        
+        # Both PowerLogs and the execution are written in one batch and one commit
+        mock_db.add_all.assert_called_once()
+        rows = mock_db.add_all.call_args[0][0]
+        assert [type(row) for row in rows] == [PowerLog, PowerLog, ScheduleExecution]
+        assert mock_db.commit.call_count == 1
     
     @pytest.mark.asyncio
-    async def test_execute_schedule_adapter_failure(self, scheduler_service, mock_db, sample_schedule_display, mock_bravia_adapter):
+    async def test_execute_schedule_adapter_failure(self, scheduler_service, mock_db, sample_schedule_display, adapter_returns):
         """Test execution logging when adapter fails."""
-        mock_bravia_adapter.set_power.return_value = False
+        adapter_returns(False)
         
         # Mock both Schedule and Display queries
-        def mock_query_side_effect(model):
-            mock_query = MagicMock()
-            if model == Schedule:
-                mock_query.filter.return_value.first.return_value = sample_schedule_display
-            elif model == Display:
-                mock_query.filter.return_value.first.return_value = sample_schedule_display.display
-            return mock_query
-        
-        mock_db.query.side_effect = mock_query_side_effect
-        mock_db.add = MagicMock()
-        mock_db.commit = MagicMock()
+        mock_db.query.side_effect = make_query_router({
+            Schedule: sample_schedule_display,
+            Display: sample_schedule_display.display,
+        })
         
         await scheduler_service.execute_schedule(sample_schedule_display.id)
         
         # Verify execution was logged as failure
-        execution = mock_db.add.call_args[0][0]
+        execution = mock_db.add_all.call_args[0][0][-1]
         assert execution.success is False
-        assert "Failed to execute power command" in execution.error_message
+        assert execution.error_message == f"Failed on 1 display(s): {sample_schedule_display.display.name}"
+    
+    @pytest.mark.asyncio
+    async def test_execute_schedule_partial_failure(self, scheduler_service, mock_db, sample_schedule_group, sample_display, adapter_returns):
+        """Test that only the displays whose command failed are named in the execution log."""
+        display2 = FakeDisplay(id=2, name="Test Display 2", ip_address="192.168.1.101", psk="test_psk_2")
+        sample_schedule_group.group.display_groups = [FakeDisplayGroup(sample_display), FakeDisplayGroup(display2)]
+        mock_db.query.return_value.filter.return_value.first.return_value = sample_schedule_group
+        mock_bravia_adapter = adapter_returns(True, Exception("Network error"))
+        
+        await scheduler_service.execute_schedule(sample_schedule_group.id)
+        
+        assert mock_bravia_adapter.set_power.call_count == 2
+        rows = mock_db.add_all.call_args[0][0]
+        assert [type(row) for row in rows] == [PowerLog, ScheduleExecution]
+        assert rows[0].display_id == sample_display.id
+        assert rows[-1].success is False
+        assert rows[-1].error_message == "Failed on 1 display(s): Test Display 2"
     
     @pytest.mark.asyncio
     async def test_execute_schedule_not_found(self, scheduler_service, mock_db):
         """Test execution when schedule doesn't exist."""
         mock_db.query.return_value.filter.return_value.first.return_value = None
-        mock_db.add = MagicMock()
         
         with patch("app.services.scheduler.logger") as mock_logger:
             await scheduler_service.execute_schedule(999)
@@ -373,32 +583,90 @@ class TestScheduleExecution:
             assert "Schedule 999 not found" in str(mock_logger.error.call_args)
         
         # Verify no execution was logged
-        mock_db.add.assert_not_called()
+        mock_db.add_all.assert_not_called()
     
     @pytest.mark.asyncio
-    async def test_execute_schedule_exception_handling(self, scheduler_service, mock_db, sample_schedule_display, mock_bravia_adapter):
+    async def test_execute_schedule_exception_handling(self, scheduler_service, mock_db, sample_schedule_display, adapter_returns):
         """Test exception handling during execution."""
-        mock_bravia_adapter.set_power.side_effect = Exception("Network error")
+        adapter_returns(Exception("Network error"))
         
         # Mock both Schedule and Display queries
-        def mock_query_side_effect(model):
-            mock_query = MagicMock()
-            if model == Schedule:
-                mock_query.filter.return_value.first.return_value = sample_schedule_display
-            elif model == Display:
-                mock_query.filter.return_value.first.return_value = sample_schedule_display.display
-            return mock_query
-        
-        mock_db.query.side_effect = mock_query_side_effect
-        mock_db.add = MagicMock()
-        mock_db.commit = MagicMock()
+        mock_db.query.side_effect = make_query_router({
+            Schedule: sample_schedule_display,
+            Display: sample_schedule_display.display,
+        })
         
         await scheduler_service.execute_schedule(sample_schedule_display.id)
         
-        # Verify execution was logged with error
-        execution = mock_db.add.call_args[0][0]
+        # Verify execution was logged with error; the exception itself is only logged
+        execution = mock_db.add_all.call_args[0][0][-1]
         assert execution.success is False
-        assert "Network error" in execution.error_message
+        assert execution.error_message == f"Failed on 1 display(s): {sample_schedule_display.display.name}"
+    
+    @pytest.mark.asyncio
+    async def test_execute_schedule_queues_log_when_started(self, scheduler_service, mock_db, sample_schedule_display):
+        """Test that a started service hands the execution log to the write-behind writer."""
+        mock_db.query.return_value.filter.return_value.first.return_value = sample_schedule_display
+        scheduler_service.start()
+        
+        await scheduler_service.execute_schedule(sample_schedule_display.id)
+        
+        # Queued, not committed by the run itself
+        mock_db.commit.assert_not_called()
+        assert scheduler_service._exec_log_queue.qsize() == 1
+        
+        await scheduler_service._exec_log_queue.join()
+        
+        mock_db.add_all.assert_called_once()
+        mock_db.commit.assert_called_once()
+        power_log, execution = mock_db.add_all.call_args[0][0]
+        assert isinstance(power_log, PowerLog)
+        assert execution.success is True
+    
+    @pytest.mark.asyncio
+    async def test_exec_log_writer_batches_queued_runs(self, scheduler_service, mock_db):
+        """Test that runs queued together are written in batches of at most EXECUTION_LOG_BATCH_SIZE."""
+        scheduler_service.start()
+        queue = scheduler_service._exec_log_queue
+        for _ in range(EXECUTION_LOG_BATCH_SIZE + 2):
+            queue.put_nowait([object(), object()])
+        
+        await queue.join()
+        
+        batch_sizes = [len(call.args[0]) for call in mock_db.add_all.call_args_list]
+        assert batch_sizes == [2 * EXECUTION_LOG_BATCH_SIZE, 4]
+        assert mock_db.commit.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_exec_log_writer_retries_failed_batch_per_run(self, scheduler_service, mock_db, caplog):
+        """Test that a failed batch is retried run by run, and runs that still fail are logged by schedule."""
+        mock_db.commit.side_effect = [Exception("database is locked"), None, Exception("disk I/O error")]
+        scheduler_service.start()
+        queue = scheduler_service._exec_log_queue
+        for schedule_id in (1, 2):
+            queue.put_nowait([PowerLog(display_id=1), ScheduleExecution(schedule_id=schedule_id, success=True)])
+        
+        await queue.join()
+        
+        batch_sizes = [len(call.args[0]) for call in mock_db.add_all.call_args_list]
+        assert batch_sizes == [4, 2, 2]
+        assert mock_db.rollback.call_count == 2
+        assert "Dropped execution log of schedule 2 (2 row(s)): disk I/O error" in caplog.text
+        assert "schedule 1 " not in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_stop_flushes_queued_exec_logs(self, scheduler_service, mock_db):
+        """Test that stopping writes execution logs the writer had not picked up yet."""
+        scheduler_service.start()
+        for _ in range(3):
+            scheduler_service._exec_log_queue.put_nowait([object()])
+        
+        scheduler_service.stop()
+        
+        batch_sizes = [len(call.args[0]) for call in mock_db.add_all.call_args_list]
+        assert batch_sizes == [3]
+        mock_db.commit.assert_called_once()
+        assert scheduler_service._exec_log_queue is None
 
 
 class TestSchedulerLifecycle:
@@ -416,8 +684,8 @@ class TestSchedulerLifecycle:
         """Test stopping the scheduler."""
         scheduler_service.start()
         scheduler_service.stop()
+        assert scheduler_service.scheduler.running is False
         
-        # After shutdown, scheduler may still show running=True briefly
         # Verify stop() doesn't raise errors (idempotent behavior)
         scheduler_service.stop()  # Should not raise
     
@@ -428,6 +696,29 @@ class TestSchedulerLifecycle:
         
         assert scheduler_service.scheduler.running is False
     
+    @pytest.mark.asyncio
+    async def test_stop_closes_own_adapter(self):
+        """Test that stopping closes a BRAVIA adapter the service created itself."""
+        with patch("app.services.scheduler.BraviaAdapter") as adapter_class:
+            adapter_class.return_value.aclose = AsyncMock()
+            service = SchedulerService(db_session=MagicMock(spec_set=Session), scheduler_factory=FakeScheduler)
+        
+        service.start()
+        service.stop()
+        service.stop()
+        await asyncio.sleep(0)
+        
+        service.adapter.aclose.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_stop_leaves_shared_adapter_open(self, scheduler_service, mock_bravia_adapter):
+        """Test that an injected adapter is left for its owner to close."""
+        scheduler_service.start()
+        scheduler_service.stop()
+        await asyncio.sleep(0)
+        
+        mock_bravia_adapter.aclose.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_double_start_is_safe(self, scheduler_service):
         """Test that starting twice doesn't cause errors."""
@@ -443,12 +734,12 @@ class TestScheduleReload:
     def test_reload_schedules_clears_old_jobs(self, scheduler_service, mock_db, sample_schedule_display):
         """Test that reload clears old jobs and loads new ones."""
         # Load initial schedule
-        mock_db.query.return_value.filter.return_value.all.return_value = [sample_schedule_display]
+        set_enabled_schedules(mock_db, [sample_schedule_display])
         scheduler_service.load_schedules_from_db()
         assert len(scheduler_service.scheduler.get_jobs()) == 1
         
         # Reload with empty database
-        mock_db.query.return_value.filter.return_value.all.return_value = []
+        set_enabled_schedules(mock_db, [])
         scheduler_service.reload_schedules()
         
         assert len(scheduler_service.scheduler.get_jobs()) == 0
@@ -456,7 +747,7 @@ class TestScheduleReload:
     def test_reload_schedules_updates_jobs(self, scheduler_service, mock_db, sample_schedule_display):
         """Test that reload updates existing schedules."""
         # Load initial schedule
-        mock_db.query.return_value.filter.return_value.all.return_value = [sample_schedule_display]
+        set_enabled_schedules(mock_db, [sample_schedule_display])
         scheduler_service.load_schedules_from_db()
         
         # Modify schedule
@@ -470,6 +761,31 @@ class TestScheduleReload:
         assert len(jobs) == 1
         trigger_str = str(jobs[0].trigger)
         assert "hour='8'" in trigger_str
+    
+    def test_reload_schedules_only_reparses_changed(self, scheduler_service, db, query_counter, caplog):
+        """Test that reload leaves unchanged schedules alone and only parses the changed cron."""
+        caplog.set_level(logging.INFO, logger="app.services.scheduler")
+        schedules = [
+            Schedule(name=f"Reload Schedule {i}", action="on", cron_expression=f"0 {i} * * *")
+            for i in range(10)
+        ]
+        db.add_all(schedules)
+        db.commit()
+        scheduler_service.db = db
+        scheduler_service.load_schedules_from_db()
+        
+        db.execute(
+            update(Schedule).where(Schedule.id == schedules[0].id).values(cron_expression="30 23 * * *"),
+            execution_options={"synchronize_session": False},
+        )
+        db.expunge_all()  # reload sees fresh instances, with no trigger parsed yet
+        
+        # Only the schedules themselves: nothing is added, so no targets are loaded for logging
+        with patch("app.db.models.parse_cron", wraps=cron.parse_cron) as parse, query_counter.assert_queries(1):
+            scheduler_service.reload_schedules()
+        
+        parse.assert_called_once_with("30 23 * * *")
+        assert len(scheduler_service.scheduler.get_jobs()) == 10
 
 
 class TestIntegration:
@@ -478,7 +794,7 @@ class TestIntegration:
     @pytest.mark.asyncio
     async def test_full_lifecycle_with_schedule(self, scheduler_service, mock_db, sample_schedule_display):
         """Test full lifecycle: load, start, stop."""
-        mock_db.query.return_value.filter.return_value.all.return_value = [sample_schedule_display]
+        set_enabled_schedules(mock_db, [sample_schedule_display])
         
         # Load schedules
         scheduler_service.load_schedules_from_db()
@@ -490,4 +806,4 @@ class TestIntegration:
         
         # Stop scheduler
         scheduler_service.stop()
-        # Verify stop() completes without error (async state may not update immediately)
+        assert scheduler_service.scheduler.running is False